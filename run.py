@@ -1,5 +1,12 @@
 """Quick run script for WiFi Password Tester."""
 
 if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:2] == ["survey"]:
+        # Headless survey: python run.py survey --interval 5 --duration 1h --out scans.jsonl
+        from src.survey import main as survey_main
+        sys.exit(survey_main(sys.argv[2:]))
+
     from src.main import main
     main()
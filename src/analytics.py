@@ -0,0 +1,278 @@
+"""Vectorized signal analytics over exported survey history (requires NumPy)."""
+
+import csv
+import json
+from array import array
+from collections import namedtuple
+from pathlib import Path
+from .export import detect_export_format
+from .frequencies import BAND_24, BAND_5, BAND_6, MAX_FREQ, lookup_frequency
+
+
+# Labels matching get_estimated_distance(), from strongest to weakest signal
+DISTANCE_LABELS = ("< 5m", "5-10m", "10-20m", "20-40m", "40-60m", "> 60m")
+_DISTANCE_EDGES = (-90, -80, -70, -60, -50)
+
+# Band codes used by bands_from_freqs(); labels match get_wifi_band()
+BAND_LABELS = ("Unknown", BAND_24, BAND_5, BAND_6)
+
+
+# Column arrays of a survey. bssid holds integer codes into bssid_labels.
+SurveyArrays = namedtuple("SurveyArrays", ["timestamp", "bssid", "signal", "frequency", "bssid_labels"])
+
+
+def _import_numpy():
+    """Import NumPy, with a helpful error if it is missing."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Survey analytics require numpy: pip install numpy")
+    return numpy
+
+
+def load_survey(paths):
+    """
+    Load exported survey files (JSON Lines, CSV or Parquet) into column arrays.
+
+    Only the timestamp, BSSID, signal and frequency columns are kept, in
+    compact typed buffers, so millions of samples fit comfortably in memory.
+    Parquet files are read column-wise, one row group at a time.
+
+    Args:
+        paths (str or list): Export file(s) written by ScanExporter
+
+    Returns:
+        SurveyArrays: NumPy column arrays for every sample
+    """
+    np = _import_numpy()
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    chunks = []
+    bssid_codes = {}
+    for path in paths:
+        if detect_export_format(path) == "parquet":
+            chunks.extend(_read_parquet_chunks(path, bssid_codes))
+        else:
+            chunks.append(_read_text_chunk(path, bssid_codes))
+
+    columns = list(zip(*chunks)) or [[]] * 4
+    dtypes = (np.float64, np.int64, np.int64, np.int64)
+    return SurveyArrays(
+        *[np.concatenate(column).astype(dtype) if column else np.zeros(0, dtype=dtype)
+          for column, dtype in zip(columns, dtypes)],
+        np.array(list(bssid_codes), dtype=object),
+    )
+
+
+def _read_text_chunk(path, bssid_codes):
+    """Read the survey columns of a JSON Lines or CSV export into typed buffers."""
+    np = _import_numpy()
+    timestamps = array("d")
+    codes = array("q")
+    signals = array("q")
+    frequencies = array("q")
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if detect_export_format(path) == "csv":
+            records = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        for record in records:
+            bssid = record["bssid"]
+            code = bssid_codes.get(bssid)
+            if code is None:
+                code = bssid_codes[bssid] = len(bssid_codes)
+            timestamps.append(float(record["timestamp"]))
+            codes.append(code)
+            signals.append(int(record["signal"]))
+            frequencies.append(int(record["frequency"] or 0))
+
+    return (
+        np.frombuffer(timestamps, dtype=np.float64),
+        np.frombuffer(codes, dtype=np.int64),
+        np.frombuffer(signals, dtype=np.int64),
+        np.frombuffer(frequencies, dtype=np.int64),
+    )
+
+
+def _read_parquet_chunks(path, bssid_codes):
+    """Yield the survey columns of a Parquet export, one row group at a time."""
+    np = _import_numpy()
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(str(path))
+    columns = ["timestamp", "bssid", "signal", "frequency"]
+    for index in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(index, columns=columns)
+        encoded = table.column("bssid").combine_chunks().dictionary_encode()
+        remap = np.array(
+            [bssid_codes.setdefault(b, len(bssid_codes)) for b in encoded.dictionary.to_pylist()],
+            dtype=np.int64,
+        )
+        yield (
+            table.column("timestamp").to_numpy(),
+            remap[encoded.indices.to_numpy()],
+            table.column("signal").to_numpy(),
+            table.column("frequency").fill_null(0).to_numpy(),
+        )
+
+
+def normalize_freqs(freqs):
+    """Convert frequencies to MHz (values above 100000 are taken as kHz)."""
+    np = _import_numpy()
+    freqs = np.asarray(freqs, dtype=np.int64)
+    return np.where(freqs > 100000, freqs // 1000, freqs)
+
+
+def signal_quality(signals):
+    """Vectorized get_signal_quality(): dBm to quality percentage."""
+    np = _import_numpy()
+    return np.clip(2 * (np.asarray(signals, dtype=np.int64) + 100), 0, 100)
+
+
+def estimated_distance(signals):
+    """Vectorized get_estimated_distance(): returns an array of distance labels."""
+    np = _import_numpy()
+    buckets = len(DISTANCE_LABELS) - 1 - np.searchsorted(
+        _DISTANCE_EDGES, np.asarray(signals), side="right"
+    )
+    return np.array(DISTANCE_LABELS, dtype=object)[buckets]
+
+
+_frequency_tables = None
+
+
+def _get_frequency_tables():
+    """NumPy lookup tables (indexed by MHz) built from the scalar frequency index."""
+    global _frequency_tables
+    if _frequency_tables is None:
+        np = _import_numpy()
+        band_codes = {label: code for code, label in enumerate(BAND_LABELS)}
+        channels = np.zeros(MAX_FREQ + 2, dtype=np.int64)
+        bands = np.zeros(MAX_FREQ + 2, dtype=np.int64)
+        for freq in range(1, MAX_FREQ + 1):
+            band, channel = lookup_frequency(freq)
+            bands[freq] = band_codes[band]
+            channels[freq] = channel if isinstance(channel, int) else 0
+        # The last slot stays "Unknown" and catches out-of-range frequencies
+        _frequency_tables = (channels, bands)
+    return _frequency_tables
+
+
+def _frequency_slots(freqs):
+    """Table indexes for an array of frequencies."""
+    np = _import_numpy()
+    freqs = normalize_freqs(freqs)
+    return np.where((freqs > 0) & (freqs <= MAX_FREQ), freqs, MAX_FREQ + 1)
+
+
+def channels_from_freqs(freqs):
+    """Vectorized get_channel_from_freq(): channel numbers, 0 where unknown."""
+    return _get_frequency_tables()[0][_frequency_slots(freqs)]
+
+
+def bands_from_freqs(freqs):
+    """Vectorized get_wifi_band(): band codes indexing BAND_LABELS."""
+    return _get_frequency_tables()[1][_frequency_slots(freqs)]
+
+
+def bssid_signal_stats(survey):
+    """
+    Per-BSSID signal statistics over the whole survey.
+
+    Returns:
+        dict: Arrays aligned with survey.bssid_labels: "bssid", "samples",
+              "mean", "std", "min", "max", "first_seen", "last_seen"
+    """
+    np = _import_numpy()
+    count = len(survey.bssid_labels)
+    signals = survey.signal.astype(np.float64)
+
+    samples = np.bincount(survey.bssid, minlength=count)
+    present = samples > 0
+    safe_samples = np.where(present, samples, 1)
+    mean = np.bincount(survey.bssid, weights=signals, minlength=count) / safe_samples
+    mean_sq = np.bincount(survey.bssid, weights=signals * signals, minlength=count) / safe_samples
+
+    minimum = np.full(count, np.inf)
+    maximum = np.full(count, -np.inf)
+    first_seen = np.full(count, np.inf)
+    last_seen = np.full(count, -np.inf)
+    np.minimum.at(minimum, survey.bssid, signals)
+    np.maximum.at(maximum, survey.bssid, signals)
+    np.minimum.at(first_seen, survey.bssid, survey.timestamp)
+    np.maximum.at(last_seen, survey.bssid, survey.timestamp)
+
+    return {
+        "bssid": survey.bssid_labels,
+        "samples": samples,
+        "mean": mean,
+        "std": np.sqrt(np.maximum(mean_sq - mean * mean, 0.0)),
+        "min": minimum,
+        "max": maximum,
+        "first_seen": first_seen,
+        "last_seen": last_seen,
+    }
+
+
+def channel_histogram(survey):
+    """
+    Number of samples and distinct BSSIDs seen on each channel of each band.
+
+    Channel numbers repeat across bands (e.g. channel 1 in 2.4 and 6 GHz),
+    so rows are keyed on (band, channel), ordered by band then channel.
+
+    Returns:
+        dict: "band" (codes indexing BAND_LABELS), "channel", "samples" and
+        "bssids" arrays (unknown channels omitted)
+    """
+    np = _import_numpy()
+    channels = channels_from_freqs(survey.frequency)
+    known = channels > 0
+    channels = channels[known]
+    bands = bands_from_freqs(survey.frequency)[known]
+    bssids = survey.bssid[known]
+
+    keys, slots, samples = np.unique(
+        np.stack([bands, channels]), axis=1, return_inverse=True, return_counts=True
+    )
+    slots = slots.reshape(-1)
+    pairs = np.unique(np.stack([slots, bssids]), axis=1)
+
+    return {
+        "band": keys[0],
+        "channel": keys[1],
+        "samples": samples,
+        "bssids": np.bincount(pairs[0], minlength=keys.shape[1]),
+    }
+
+
+def band_utilisation(survey):
+    """
+    Share of samples, distinct BSSIDs and mean signal per band.
+
+    Returns:
+        dict: Band label -> {"samples", "share", "bssids", "mean_signal"}
+    """
+    np = _import_numpy()
+    bands = bands_from_freqs(survey.frequency)
+    band_count = len(BAND_LABELS)
+    total = max(len(bands), 1)
+
+    samples = np.bincount(bands, minlength=band_count)
+    signal_sums = np.bincount(bands, weights=survey.signal.astype(np.float64), minlength=band_count)
+    pairs = np.unique(np.stack([bands, survey.bssid]), axis=1)
+    bssids = np.bincount(pairs[0], minlength=band_count)
+
+    summary = {}
+    for code, label in enumerate(BAND_LABELS):
+        if samples[code] == 0:
+            continue
+        summary[label] = {
+            "samples": int(samples[code]),
+            "share": float(samples[code] / total),
+            "bssids": int(bssids[code]),
+            "mean_signal": float(signal_sums[code] / samples[code]),
+        }
+    return summary
@@ -0,0 +1,223 @@
+"""Pluggable WiFi backends: real adapters via pywifi, or replayed scan results."""
+
+import json
+import random
+import threading
+import time
+from pywifi import const
+
+
+class PyWiFiBackend:
+    """Real WiFi adapters through pywifi."""
+
+    name = "pywifi"
+
+    def interfaces(self):
+        """Return the system's WiFi interfaces."""
+        import pywifi
+        return pywifi.PyWiFi().interfaces()
+
+
+class ReplayNetwork:
+    """Scan result with the same attributes as a pywifi Profile."""
+
+    __slots__ = ("id", "ssid", "bssid", "signal", "freq", "auth", "akm", "cipher", "key")
+
+    def __init__(self, ssid, bssid, signal, freq, auth=None, akm=None, cipher=const.CIPHER_TYPE_CCMP):
+        self.id = 0
+        self.ssid = ssid
+        self.bssid = bssid
+        self.signal = signal
+        self.freq = freq
+        self.auth = auth if auth is not None else [const.AUTH_ALG_OPEN]
+        self.akm = akm if akm is not None else [const.AKM_TYPE_WPA2PSK]
+        self.cipher = cipher
+        self.key = None
+
+    def to_record(self):
+        """Serializable form used by replay files."""
+        return {name: getattr(self, name) for name in self.__slots__ if name not in ("id", "key")}
+
+
+class ReplayInterface:
+    """
+    Interface that serves a fixed sequence of scans.
+
+    Each scan() call advances to the next recorded scan (wrapping around).
+    The interface reports IFACE_SCANNING for scan_latency seconds after a
+    scan is triggered, and every scan_results() call takes results_latency.
+    """
+
+    def __init__(self, name, scans, scan_latency=0.0, results_latency=0.0):
+        self._name = name
+        self._scans = scans
+        self.scan_latency = scan_latency
+        self.results_latency = results_latency
+        self._index = -1
+        self._scan_started = 0.0
+        self._lock = threading.Lock()
+
+    def name(self):
+        return self._name
+
+    def scan(self):
+        with self._lock:
+            self._index = (self._index + 1) % len(self._scans)
+            self._scan_started = time.monotonic()
+
+    def scan_results(self):
+        if self.results_latency:
+            time.sleep(self.results_latency)
+        if self._index < 0:
+            return []
+        return list(self._scans[self._index])
+
+    def status(self):
+        if time.monotonic() - self._scan_started < self.scan_latency:
+            return const.IFACE_SCANNING
+        return const.IFACE_DISCONNECTED
+
+    def disconnect(self):
+        pass
+
+    def remove_all_network_profiles(self):
+        pass
+
+    def add_network_profile(self, profile):
+        return profile
+
+    def connect(self, profile):
+        pass
+
+
+class ReplayBackend:
+    """Backend whose interfaces replay recorded or synthetic scans."""
+
+    name = "replay"
+
+    def __init__(self, scans, interface_count=1, scan_latency=0.0, results_latency=0.0):
+        if not scans:
+            raise ValueError("ReplayBackend needs at least one scan")
+        self._interfaces = [
+            ReplayInterface(f"replay{index}", scans, scan_latency, results_latency)
+            for index in range(interface_count)
+        ]
+
+    def interfaces(self):
+        return list(self._interfaces)
+
+    @classmethod
+    def synthetic(cls, ap_count, scan_count=1, seed=0, **kwargs):
+        """Backend serving generate_synthetic_scans(ap_count, scan_count, seed)."""
+        return cls(generate_synthetic_scans(ap_count, scan_count, seed), **kwargs)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Backend serving the scans saved in a replay file (see save_scans)."""
+        return cls(load_scans(path), **kwargs)
+
+
+# Frequencies used for synthetic access points (2.4, 5 and 6 GHz)
+SYNTHETIC_FREQS = (2412, 2437, 2462, 5180, 5220, 5500, 5745, 5805, 5955, 6115, 6435)
+
+# Common security setups: (akm list, cipher)
+SYNTHETIC_SECURITY = (
+    ([const.AKM_TYPE_WPA2PSK], const.CIPHER_TYPE_CCMP),
+    ([const.AKM_TYPE_WPA2PSK], const.CIPHER_TYPE_CCMP),
+    ([const.AKM_TYPE_WPAPSK], const.CIPHER_TYPE_TKIP),
+    ([const.AKM_TYPE_WPA2], const.CIPHER_TYPE_CCMP),
+    ([const.AKM_TYPE_NONE], const.CIPHER_TYPE_NONE),
+)
+
+
+def generate_synthetic_scans(ap_count, scan_count=1, seed=0):
+    """
+    Generate deterministic scans of ap_count access points.
+
+    Access points are spread over ap_count / 8 SSIDs and all three bands.
+    Later scans jitter each signal by a few dBm and drop about 2% of APs.
+
+    Returns:
+        list: scan_count lists of ReplayNetwork objects
+    """
+    from .vendors import MAC_VENDORS
+
+    rng = random.Random(seed)
+    prefixes = sorted(MAC_VENDORS)
+    ssid_count = max(ap_count // 8, 1)
+
+    base = []
+    for index in range(ap_count):
+        akm, cipher = rng.choice(SYNTHETIC_SECURITY)
+        bssid = "{}:{:02X}:{:02X}:{:02X}".format(
+            rng.choice(prefixes), (index >> 16) & 0xFF, (index >> 8) & 0xFF, index & 0xFF
+        )
+        base.append(ReplayNetwork(
+            ssid=f"Survey-{index % ssid_count:04d}",
+            bssid=bssid,
+            signal=rng.randint(-95, -30),
+            freq=rng.choice(SYNTHETIC_FREQS),
+            akm=list(akm),
+            cipher=cipher,
+        ))
+
+    scans = [base]
+    for _ in range(scan_count - 1):
+        scan = []
+        for network in base:
+            if rng.random() < 0.02:
+                continue
+            scan.append(ReplayNetwork(
+                network.ssid, network.bssid,
+                max(-100, min(-20, network.signal + rng.randint(-3, 3))),
+                network.freq, list(network.auth), list(network.akm), network.cipher,
+            ))
+        scans.append(scan)
+    return scans
+
+
+def network_to_record(network):
+    """Serializable form of any scan result (pywifi Profile or ReplayNetwork)."""
+    ssid = network.ssid
+    if isinstance(ssid, bytes):
+        ssid = ssid.decode("utf-8", errors="ignore")
+    return {
+        "ssid": ssid,
+        "bssid": getattr(network, "bssid", None),
+        "signal": network.signal,
+        "freq": getattr(network, "freq", 0),
+        "auth": list(network.auth) if isinstance(network.auth, list) else [network.auth],
+        "akm": list(network.akm) if isinstance(network.akm, list) else [network.akm],
+        "cipher": network.cipher,
+    }
+
+
+def save_scans(path, scans):
+    """Save a list of scans (lists of scan results) as a replay file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"scans": [[network_to_record(n) for n in scan] for scan in scans]},
+                  f, ensure_ascii=False)
+
+
+def load_scans(path):
+    """Load the scans of a replay file as lists of ReplayNetwork objects."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [[ReplayNetwork(**record) for record in scan] for scan in data.get("scans", [])]
+
+
+_backend = None
+
+
+def get_backend():
+    """Return the active backend (pywifi unless set_backend was called)."""
+    global _backend
+    if _backend is None:
+        _backend = PyWiFiBackend()
+    return _backend
+
+
+def set_backend(backend):
+    """Use a different backend, e.g. a ReplayBackend for benchmarks."""
+    global _backend
+    _backend = backend
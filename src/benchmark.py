@@ -0,0 +1,195 @@
+"""
+Benchmarks for the scan -> details -> history -> display pipeline.
+
+Runs against a ReplayBackend with synthetic access points, so no WiFi
+hardware is needed and results are comparable between runs. Cold import
+times of the entry point modules are measured first:
+
+    python -m src.benchmark
+    python -m src.benchmark --sizes 10 100 --repeat 3 --json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from . import timing
+from .history import close_history_store
+
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 5
+
+# Modules whose cold import time is measured (the CLI entry point first)
+IMPORT_MODULES = ("src.main", "src.scanner", "src.survey")
+
+# Directory containing the src package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def time_call(func, repeat, setup=None):
+    """Run func repeat times and return the wall-clock durations in ms."""
+    durations = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000.0)
+    return durations
+
+
+def summarize(name, size, durations):
+    """Summary row for one benchmark at one AP count."""
+    return {
+        "benchmark": name,
+        "aps": size,
+        "runs": len(durations),
+        "min_ms": round(min(durations), 3),
+        "median_ms": round(statistics.median(durations), 3),
+        "max_ms": round(max(durations), 3),
+    }
+
+
+def import_time_ms(module):
+    """
+    Cold import time of a module in a fresh interpreter.
+
+    Uses the interpreter's own -X importtime report, so interpreter startup
+    and process creation are not counted.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in reversed(completed.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000.0
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def run_import_benchmarks(modules=IMPORT_MODULES, repeat=DEFAULT_REPEAT):
+    """Benchmark the cold import time of each module (aps is None)."""
+    return [
+        summarize(f"import {module}", None, [import_time_ms(module) for _ in range(repeat)])
+        for module in modules
+    ]
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, scan_latency=0.0):
+    """
+    Benchmark each pipeline stage at each AP count.
+
+    Returns:
+        list: Summary rows (see summarize)
+    """
+    from . import scanner
+    from .backends import ReplayBackend, set_backend
+    from .history import HistoryStore
+
+    results = []
+    for size in sizes:
+        backend = ReplayBackend.synthetic(size, scan_count=3, scan_latency=scan_latency)
+        set_backend(backend)
+        iface = backend.interfaces()[0]
+
+        # Full scan cycle, including completion polling
+        durations = time_call(
+            lambda: scanner.scan_networks_once(iface, verbose=False, disconnect=False, per_bssid=True),
+            max(1, min(repeat, 3)),
+        )
+        results.append(summarize("scan_networks_once", size, durations))
+
+        networks = scanner.collect_scan_results(iface, verbose=False, disconnect=False, per_bssid=True)
+
+        # Details extraction for a fresh scan (cache cleared before every run)
+        durations = time_call(
+            lambda: scanner.get_scan_details(networks),
+            repeat,
+            setup=scanner._details_cache.clear,
+        )
+        results.append(summarize("get_network_details", size, durations))
+
+        # Cached details lookups (what the display and attack paths pay)
+        durations = time_call(lambda: scanner.get_scan_details(networks), repeat)
+        results.append(summarize("get_network_details (cached)", size, durations))
+
+        # History persistence: one batched transaction per scan
+        store = HistoryStore(f"bench_history_{size}.db", legacy_path=None)
+        keys = [(scanner.decode_ssid(n), scanner.get_bssid(n)) for n in networks]
+        durations = time_call(lambda: store.record_sightings(keys), repeat)
+        store.close()
+        results.append(summarize("history.record_sightings", size, durations))
+
+        # Rendering, written to an in-memory stream
+        for detailed in (False, True):
+            def render():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    scanner.display_networks(networks, detailed=detailed)
+            durations = time_call(render, repeat)
+            name = "display_networks (detailed)" if detailed else "display_networks (compact)"
+            results.append(summarize(name, size, durations))
+
+    return results
+
+
+def format_results(results):
+    """Format summary rows as a plain-text table."""
+    lines = [f"{'benchmark':34} {'APs':>6} {'min ms':>10} {'median ms':>10} {'max ms':>10}"]
+    lines.append("─" * len(lines[0]))
+    for row in results:
+        aps = "-" if row["aps"] is None else row["aps"]
+        lines.append(f"{row['benchmark']:34} {aps:>6} {row['min_ms']:>10.3f} "
+                     f"{row['median_ms']:>10.3f} {row['max_ms']:>10.3f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark suite and print the results."""
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="access point counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per benchmark")
+    parser.add_argument("--scan-latency", type=float, default=0.0,
+                        help="simulated time (s) the replay interface spends scanning")
+    parser.add_argument("--skip-imports", action="store_true", help="don't measure module import times")
+    parser.add_argument("--timings", metavar="FILE",
+                        help="also record per-stage timings of the runs and write them as JSON")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [] if args.skip_imports else run_import_benchmarks(repeat=args.repeat)
+
+    # Keep history databases out of the working directory
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        if args.timings:
+            timing.enable()
+        try:
+            results += run_benchmarks(args.sizes, args.repeat, args.scan_latency)
+        finally:
+            timings = timing.disable()
+            close_history_store()
+            os.chdir(original_cwd)
+
+    if timings is not None:
+        timing.write_summary(args.timings, timings)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Channel congestion and overlap report built from scan results."""
+
+from collections import namedtuple
+from .utils import Colors
+
+
+# 2.4 GHz channel centre frequencies (MHz)
+CHANNEL_FREQS_24 = {channel: 2407 + 5 * channel for channel in range(1, 14)}
+CHANNEL_FREQS_24[14] = 2484
+
+# Width of a 2.4 GHz channel (MHz); channels closer than this overlap
+CHANNEL_WIDTH_24 = 22
+
+# Channels worth recommending
+NON_OVERLAPPING_24 = (1, 6, 11)
+PREFERRED_5 = (36, 40, 44, 48, 149, 153, 157, 161, 165)
+
+
+def _build_overlap_table():
+    """Fraction of spectral overlap between every pair of 2.4 GHz channels."""
+    table = {}
+    for a, freq_a in CHANNEL_FREQS_24.items():
+        row = {}
+        for b, freq_b in CHANNEL_FREQS_24.items():
+            overlap = 1.0 - abs(freq_a - freq_b) / CHANNEL_WIDTH_24
+            if overlap > 0:
+                row[b] = overlap
+        table[a] = row
+    return table
+
+
+# Precomputed once: OVERLAP_24[a][b] is 1.0 for a == b and falls to 0 at 22 MHz
+OVERLAP_24 = _build_overlap_table()
+
+
+# aps/load count every AP on the channel; co_channel counts the other APs
+# sharing it and adjacent is the overlap-weighted load from nearby channels
+ChannelLoad = namedtuple("ChannelLoad", ["channel", "aps", "load", "co_channel", "adjacent", "congestion"])
+
+ChannelReport = namedtuple("ChannelReport", ["band_24", "band_5", "band_6", "recommended_24", "recommended_5"])
+
+
+def signal_weight(signal_dbm):
+    """Weight an access point's contribution to channel load by its signal (0-1)."""
+    if signal_dbm >= -50:
+        return 1.0
+    elif signal_dbm <= -100:
+        return 0.0
+    return (signal_dbm + 100) / 50.0
+
+
+def build_channel_report(scan_details):
+    """
+    Build a channel planning report from a scan.
+
+    Access points are aggregated per channel in one pass; 2.4 GHz overlap is
+    then applied with the precomputed OVERLAP_24 table, so the cost grows with
+    the number of channels rather than the number of AP pairs.
+
+    Args:
+        scan_details (list): NetworkDetails records (one per access point)
+
+    Returns:
+        ChannelReport: Per-channel load for each band plus recommendations
+    """
+    counts = {"2.4": {}, "5": {}, "6": {}}
+    loads = {"2.4": {}, "5": {}, "6": {}}
+
+    for details in scan_details:
+        if not isinstance(details.channel, int):
+            continue
+        band = details.band.split(" ")[0]
+        if band not in counts:
+            continue
+        channel = details.channel
+        counts[band][channel] = counts[band].get(channel, 0) + 1
+        loads[band][channel] = loads[band].get(channel, 0.0) + signal_weight(details.signal)
+
+    band_24 = []
+    for channel in sorted(CHANNEL_FREQS_24):
+        adjacent = sum(
+            overlap * loads["2.4"].get(other, 0.0)
+            for other, overlap in OVERLAP_24[channel].items()
+            if other != channel
+        )
+        aps = counts["2.4"].get(channel, 0)
+        load = loads["2.4"].get(channel, 0.0)
+        if aps or adjacent:
+            band_24.append(ChannelLoad(channel, aps, load, max(aps - 1, 0), adjacent, load + adjacent))
+
+    band_5 = _flat_band_loads(counts["5"], loads["5"])
+    band_6 = _flat_band_loads(counts["6"], loads["6"])
+
+    congestion_24 = {entry.channel: entry.congestion for entry in band_24}
+    recommended_24 = min(NON_OVERLAPPING_24, key=lambda c: congestion_24.get(c, 0.0))
+    recommended_5 = min(PREFERRED_5, key=lambda c: loads["5"].get(c, 0.0))
+
+    return ChannelReport(band_24, band_5, band_6, recommended_24, recommended_5)
+
+
+def _flat_band_loads(counts, loads):
+    """Per-channel loads for bands whose 20 MHz channels don't overlap."""
+    return [
+        ChannelLoad(channel, counts[channel], loads[channel], counts[channel] - 1, 0.0, loads[channel])
+        for channel in sorted(counts)
+    ]
+
+
+def display_channel_report(report):
+    """Display per-channel congestion and the recommended channels."""
+    print(f"\n{Colors.CYAN}{'═' * 68}{Colors.RESET}")
+    print(f"{Colors.BOLD}{Colors.WHITE}[*] CHANNEL CONGESTION REPORT{Colors.RESET}")
+    print(f"{Colors.CYAN}{'═' * 68}{Colors.RESET}")
+
+    for title, entries in (("2.4 GHz", report.band_24), ("5 GHz", report.band_5), ("6 GHz", report.band_6)):
+        if not entries:
+            continue
+        print(f"{Colors.MAGENTA}{title}{Colors.RESET}")
+        busiest = max(entry.congestion for entry in entries) or 1.0
+        for entry in entries:
+            bar = "█" * int(round(20 * entry.congestion / busiest))
+            color = Colors.RED if entry.congestion >= 0.66 * busiest else (
+                Colors.YELLOW if entry.congestion >= 0.33 * busiest else Colors.GREEN)
+            print(f"    {Colors.WHITE}Ch {entry.channel:>3}{Colors.RESET} │ "
+                  f"{Colors.CYAN}{entry.aps:3} APs{Colors.RESET} │ "
+                  f"{Colors.WHITE}Load:{Colors.RESET} {entry.load:5.2f} │ "
+                  f"{Colors.WHITE}Adjacent:{Colors.RESET} {entry.adjacent:5.2f} │ "
+                  f"{color}{bar}{Colors.RESET}")
+
+    print(f"{Colors.GREEN}[✓] Recommended:{Colors.RESET} "
+          f"{Colors.WHITE}2.4 GHz ch {Colors.CYAN}{report.recommended_24}{Colors.RESET} │ "
+          f"{Colors.WHITE}5 GHz ch {Colors.CYAN}{report.recommended_5}{Colors.RESET}")
+    print(f"{Colors.CYAN}{'═' * 68}{Colors.RESET}")
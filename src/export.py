@@ -0,0 +1,218 @@
+"""Streaming export of survey scans to JSON Lines, CSV or Parquet files."""
+
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+
+# Columns written for every access point of every scan
+EXPORT_FIELDS = (
+    "timestamp", "ssid", "bssid", "signal", "frequency", "channel", "band",
+    "vendor", "auth", "akm", "cipher", "security_rating", "wps_enabled",
+    "interface",
+)
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+
+def detect_export_format(path):
+    """Infer the export format from a file name (defaults to JSON Lines)."""
+    suffix = Path(path).suffix.lower().lstrip(".")
+    if suffix in ("csv", "parquet"):
+        return suffix
+    return "jsonl"
+
+
+def scan_rows(scan_details, timestamp):
+    """Convert one scan's NetworkDetails records into export rows."""
+    rows = []
+    for details in scan_details:
+        channel = details.channel if isinstance(details.channel, int) else None
+        rows.append((
+            timestamp, details.ssid, details.bssid, details.signal,
+            details.frequency, channel, details.band, details.vendor,
+            details.auth, details.akm, details.cipher,
+            details.security_rating, details.wps_enabled, details.interface,
+        ))
+    return rows
+
+
+class ScanExporter:
+    """
+    Append-only, size-rotated export of survey scans.
+
+    Each scan is serialized into one buffer and written with a single call,
+    so export cost is per scan rather than per network. When the file grows
+    past max_bytes it is rotated to <name>.1, <name>.2, ... like a log file.
+
+    The Parquet format needs the optional pyarrow package; every scan becomes
+    one row group, so long surveys can be read back column by column.
+    """
+
+    def __init__(self, path, export_format=None, max_bytes=DEFAULT_MAX_BYTES,
+                 backup_count=DEFAULT_BACKUP_COUNT):
+        self.path = Path(path)
+        self.format = export_format or detect_export_format(path)
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{self.format}' "
+                             f"(expected one of: {', '.join(EXPORT_FORMATS)})")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rows_written = 0
+        self._file = None
+        self._parquet_writer = None
+
+        if self.format == "parquet":
+            # Fail early rather than on the first scan
+            _import_pyarrow()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        """
+        Check that the export target can be written, before the first scan.
+
+        Text formats open the file for appending; Parquet files are created
+        on the first scan, so only their directory is checked.
+
+        Raises:
+            OSError: If the file or its directory can't be written
+        """
+        if self.format == "parquet":
+            directory = self.path.parent
+            if not directory.is_dir():
+                raise FileNotFoundError(f"No such directory: '{directory}'")
+            if not os.access(directory, os.W_OK) or (
+                    self.path.exists() and not os.access(self.path, os.W_OK)):
+                raise PermissionError(f"Permission denied: '{self.path}'")
+        else:
+            self._open_text()
+        return self
+
+    def write_scan(self, scan_details, timestamp=None):
+        """
+        Append one scan's records.
+
+        Args:
+            scan_details (list): NetworkDetails records from a single scan
+            timestamp (float): Epoch time of the scan (defaults to now)
+        """
+        rows = scan_rows(scan_details, time.time() if timestamp is None else timestamp)
+        if not rows:
+            return
+
+        if self._should_rotate():
+            self._rotate()
+
+        if self.format == "parquet":
+            self._write_parquet(rows)
+        elif self.format == "csv":
+            self._write_csv(rows)
+        else:
+            self._write_jsonl(rows)
+        self.rows_written += len(rows)
+
+    def close(self):
+        """Flush and close the current export file."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _should_rotate(self):
+        """Return True if the current file has reached max_bytes."""
+        if not self.max_bytes or not self.path.exists():
+            return False
+        return self.path.stat().st_size >= self.max_bytes
+
+    def _rotate(self):
+        """Shift <name>.N backups up by one and move the current file to <name>.1."""
+        self.close()
+        if self.backup_count <= 0:
+            self.path.unlink()
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+    def _open_text(self):
+        """Open the current text export file for appending."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8", newline="")
+        return self._file
+
+    def _write_jsonl(self, rows):
+        buffer = "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+        f = self._open_text()
+        f.write(buffer)
+        f.flush()
+
+    def _write_csv(self, rows):
+        write_header = not self.path.exists() or self.path.stat().st_size == 0
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if write_header:
+            writer.writerow(EXPORT_FIELDS)
+        writer.writerows(rows)
+        f = self._open_text()
+        f.write(buffer.getvalue())
+        f.flush()
+
+    def _write_parquet(self, rows):
+        pa, pq = _import_pyarrow()
+        schema = _parquet_schema(pa)
+        if self._parquet_writer is None:
+            # Parquet files can't be appended to, so start a fresh file
+            if self.path.exists():
+                self._rotate()
+            self._parquet_writer = pq.ParquetWriter(str(self.path), schema)
+        arrays = [pa.array(column, type=field.type)
+                  for column, field in zip(zip(*rows), schema)]
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+
+def _import_pyarrow():
+    """Import pyarrow for Parquet export, with a helpful error if it is missing."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+
+def _parquet_schema(pa):
+    """Arrow schema matching EXPORT_FIELDS."""
+    return pa.schema([
+        ("timestamp", pa.float64()),
+        ("ssid", pa.string()),
+        ("bssid", pa.string()),
+        ("signal", pa.int32()),
+        ("frequency", pa.int64()),
+        ("channel", pa.int32()),
+        ("band", pa.string()),
+        ("vendor", pa.string()),
+        ("auth", pa.string()),
+        ("akm", pa.string()),
+        ("cipher", pa.string()),
+        ("security_rating", pa.string()),
+        ("wps_enabled", pa.bool_()),
+        ("interface", pa.string()),
+    ])
@@ -0,0 +1,103 @@
+"""Frequency to WiFi band/channel lookup tables (2.4, 5 and 6 GHz)."""
+
+
+BAND_24 = "2.4 GHz"
+BAND_5 = "5 GHz"
+BAND_6 = "6 GHz (WiFi 6E)"
+
+# Highest frequency (MHz) that belongs to any WiFi band handled here
+MAX_FREQ = 7125
+
+
+def _build_frequency_index():
+    """Map every channel centre frequency (MHz) to its (band, channel)."""
+    index = {}
+
+    # 2.4 GHz: channels 1-13 every 5 MHz, channel 14 on its own
+    for channel in range(1, 14):
+        index[2407 + 5 * channel] = (BAND_24, channel)
+    index[2484] = (BAND_24, 14)
+
+    # 5 GHz: channel n is centred on 5000 + 5n (channels 32-177)
+    for channel in range(32, 178):
+        index[5000 + 5 * channel] = (BAND_5, channel)
+
+    # 6 GHz: channel n is centred on 5950 + 5n (channels 1-233), plus channel 2
+    for channel in range(1, 234):
+        index[5950 + 5 * channel] = (BAND_6, channel)
+    index[5935] = (BAND_6, 2)
+
+    return index
+
+
+# Precomputed once at import: MHz -> (band, channel)
+FREQUENCY_INDEX = _build_frequency_index()
+
+
+def normalize_freq(freq):
+    """Convert a frequency to MHz (pywifi may report kHz)."""
+    if freq > 100000:
+        return freq // 1000
+    return freq
+
+
+def _band_from_range(freq):
+    """Band for frequencies that are not a channel centre."""
+    if 2400 <= freq <= 2500:
+        return BAND_24
+    elif 5000 <= freq <= 5925:
+        return BAND_5
+    elif 5925 < freq <= MAX_FREQ:
+        return BAND_6
+    return "Unknown"
+
+
+def lookup_frequency(freq):
+    """
+    Resolve a frequency to its band and channel with a single table lookup.
+
+    Args:
+        freq (int): Frequency in MHz or kHz
+
+    Returns:
+        tuple: (band, channel); channel is "Unknown" off the channel grid
+    """
+    if not freq:
+        return "Unknown", "Unknown"
+    freq = normalize_freq(freq)
+    entry = FREQUENCY_INDEX.get(freq)
+    if entry is not None:
+        return entry
+    return _band_from_range(freq), "Unknown"
+
+
+def get_wifi_band(freq):
+    """Determine WiFi band from frequency."""
+    return lookup_frequency(freq)[0]
+
+
+def get_channel_from_freq(freq):
+    """Convert frequency to WiFi channel number."""
+    return lookup_frequency(freq)[1]
+
+
+def get_channels_from_freqs(freqs):
+    """
+    Resolve a batch of frequencies to (band, channel) pairs.
+
+    Args:
+        freqs (iterable): Frequencies in MHz or kHz
+
+    Returns:
+        list: (band, channel) tuples in the same order
+    """
+    index_get = FREQUENCY_INDEX.get
+    results = []
+    for freq in freqs:
+        if not freq:
+            results.append(("Unknown", "Unknown"))
+            continue
+        freq = normalize_freq(freq)
+        entry = index_get(freq)
+        results.append(entry if entry is not None else (_band_from_range(freq), "Unknown"))
+    return results
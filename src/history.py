@@ -0,0 +1,365 @@
+"""Network appearance history backed by an indexed SQLite store."""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# Default history locations (relative to the working directory)
+HISTORY_DB = "network_history.db"
+LEGACY_HISTORY_FILE = "network_history.json"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+# Sightings are counted in hourly buckets, which are rolled up into daily
+# buckets once they are older than HOURLY_RETENTION. Daily buckets, and
+# networks not seen at all, are dropped after DAILY_RETENTION.
+HOURLY_RETENTION = 14 * SECONDS_PER_DAY
+DAILY_RETENTION = 365 * SECONDS_PER_DAY
+
+# Minimum time between automatic compactions
+COMPACT_INTERVAL = SECONDS_PER_HOUR
+
+# (ssid, bssid) pairs read back per query after recording a scan; two bound
+# parameters each, kept under the 999-parameter limit of SQLite < 3.32
+READ_BATCH_SIZE = 249
+
+
+def get_stability_label(days_active):
+    """Classify how stable a network is from the number of days it has been seen."""
+    if days_active > 7:
+        return "Very Stable"
+    elif days_active > 3:
+        return "Stable"
+    elif days_active > 1:
+        return "Moderate"
+    else:
+        return "New/Transient"
+
+
+def format_timestamp(timestamp):
+    """Format an epoch timestamp the way history entries have always been shown."""
+    return datetime.fromtimestamp(timestamp).strftime(TIME_FORMAT)
+
+
+def local_day(timestamp):
+    """Number of the local calendar day an epoch timestamp falls on."""
+    return int((timestamp + time.localtime(timestamp).tm_gmtoff) // SECONDS_PER_DAY)
+
+
+def local_midnight(timestamp):
+    """Epoch time of the local midnight starting the day of a timestamp."""
+    day = datetime.fromtimestamp(timestamp)
+    return int(day.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+
+
+class HistoryStore:
+    """
+    Per-network sighting history keyed on (ssid, bssid).
+
+    Every scan is recorded with a single batched transaction, so updating the
+    history costs one indexed upsert per network instead of a full rewrite.
+
+    Besides the first/last sighting, sightings are counted in hourly buckets
+    (epoch seconds, UTC-aligned) that are downsampled to daily buckets after
+    hourly_retention and dropped after daily_retention, so the store stays
+    bounded however long the survey runs. Stability is the number of distinct
+    days a network was seen on.
+    """
+
+    def __init__(self, path=HISTORY_DB, legacy_path=LEGACY_HISTORY_FILE,
+                 hourly_retention=HOURLY_RETENTION, daily_retention=DAILY_RETENTION):
+        if daily_retention < hourly_retention:
+            raise ValueError("daily_retention must not be shorter than hourly_retention")
+        self.path = str(path)
+        self.hourly_retention = hourly_retention
+        self.daily_retention = daily_retention
+        self._last_compaction = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Active days and daily buckets follow local days, like the displayed timestamps
+        self._conn.create_function("local_day", 1, local_day, deterministic=True)
+        self._conn.create_function("local_midnight", 1, local_midnight, deterministic=True)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS networks (
+                ssid TEXT NOT NULL,
+                bssid TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                seen_count INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (ssid, bssid)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sightings (
+                ssid TEXT NOT NULL,
+                bssid TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (ssid, bssid, resolution, bucket)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS sightings_by_bucket ON sightings (resolution, bucket)"
+        )
+        self._migrate()
+        self._conn.commit()
+
+        if legacy_path:
+            self._import_legacy(Path(legacy_path))
+
+    def _migrate(self):
+        """Add the active_days column to stores created before bucketed history."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(networks)")}
+        if "active_days" not in columns:
+            self._conn.execute(
+                "ALTER TABLE networks ADD COLUMN active_days INTEGER NOT NULL DEFAULT 1"
+            )
+            # Without buckets, the days between first and last sighting are the best estimate
+            self._conn.execute(
+                "UPDATE networks SET active_days = "
+                "local_day(last_seen) - local_day(first_seen) + 1"
+            )
+
+    def _import_legacy(self, legacy_file):
+        """Import entries from the old network_history.json once, if the store is empty."""
+        if not legacy_file.exists():
+            return
+        if self._conn.execute("SELECT 1 FROM networks LIMIT 1").fetchone():
+            return
+
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        rows = []
+        for entry in history.get("networks", {}).values():
+            try:
+                first_seen = time.mktime(time.strptime(entry["first_seen"], TIME_FORMAT))
+                last_seen = time.mktime(time.strptime(entry["last_seen"], TIME_FORMAT))
+            except (KeyError, TypeError, ValueError):
+                continue
+            rows.append((
+                entry.get("ssid", ""),
+                entry.get("bssid", "Unknown"),
+                first_seen,
+                last_seen,
+                entry.get("seen_count", 1),
+                local_day(last_seen) - local_day(first_seen) + 1,
+            ))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO networks "
+                "(ssid, bssid, first_seen, last_seen, seen_count, active_days) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def record_sightings(self, networks, timestamp=None):
+        """
+        Record one sighting for every (ssid, bssid) pair of a scan.
+
+        Args:
+            networks (iterable): (ssid, bssid) pairs seen in the scan
+            timestamp (float): Epoch time of the scan (defaults to now)
+
+        Returns:
+            dict: Mapping of (ssid, bssid) to its updated history entry
+        """
+        now = time.time() if timestamp is None else timestamp
+        keys = list(dict.fromkeys(networks))
+        if not keys:
+            return {}
+
+        if now - self._last_compaction >= COMPACT_INTERVAL:
+            self.compact(now)
+
+        hour = int(now // SECONDS_PER_HOUR) * SECONDS_PER_HOUR
+        results = {}
+        with self._lock, self._conn:
+            # A sighting on a later local day than the previous one adds an active day
+            self._conn.executemany(
+                """
+                INSERT INTO networks (ssid, bssid, first_seen, last_seen, seen_count, active_days)
+                VALUES (?, ?, ?, ?, 1, 1)
+                ON CONFLICT (ssid, bssid) DO UPDATE SET
+                    active_days = active_days + (
+                        local_day(excluded.last_seen) > local_day(last_seen)
+                    ),
+                    last_seen = MAX(last_seen, excluded.last_seen),
+                    seen_count = seen_count + 1
+                """,
+                [(ssid, bssid, now, now) for ssid, bssid in keys],
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO sightings (ssid, bssid, resolution, bucket, count)
+                VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT (ssid, bssid, resolution, bucket) DO UPDATE SET
+                    count = count + 1
+                """,
+                [(ssid, bssid, SECONDS_PER_HOUR, hour) for ssid, bssid in keys],
+            )
+            # Read the updated rows back in batches rather than one query per network
+            for start in range(0, len(keys), READ_BATCH_SIZE):
+                batch = keys[start:start + READ_BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT ssid, bssid, first_seen, last_seen, seen_count, active_days "
+                    "FROM networks WHERE (ssid, bssid) IN (VALUES "
+                    + ", ".join(["(?, ?)"] * len(batch)) + ")",
+                    [value for key in batch for value in key],
+                )
+                for row in rows:
+                    results[(row[0], row[1])] = self._make_entry(*row)
+
+        return results
+
+    def compact(self, now=None):
+        """
+        Downsample and expire old sightings.
+
+        Hourly buckets older than hourly_retention are summed into daily
+        buckets; daily buckets older than daily_retention are dropped (and
+        their days no longer count as active), as are networks last seen
+        before then.
+        """
+        now = time.time() if now is None else now
+        hourly_cutoff = now - self.hourly_retention
+        daily_cutoff = local_midnight(now - self.daily_retention)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO sightings (ssid, bssid, resolution, bucket, count)
+                SELECT ssid, bssid, ?, local_midnight(bucket) AS day, SUM(count) FROM sightings
+                WHERE resolution = ? AND bucket < ?
+                GROUP BY ssid, bssid, day
+                ON CONFLICT (ssid, bssid, resolution, bucket) DO UPDATE SET
+                    count = count + excluded.count
+                """,
+                (SECONDS_PER_DAY, SECONDS_PER_HOUR, hourly_cutoff),
+            )
+            self._conn.execute(
+                "DELETE FROM sightings WHERE resolution = ? AND bucket < ?",
+                (SECONDS_PER_HOUR, hourly_cutoff),
+            )
+            self._conn.execute(
+                """
+                UPDATE networks SET active_days = MAX(1, active_days - (
+                    SELECT COUNT(*) FROM sightings AS s
+                    WHERE s.ssid = networks.ssid AND s.bssid = networks.bssid
+                      AND s.resolution = ? AND s.bucket < ?
+                ))
+                WHERE EXISTS (
+                    SELECT 1 FROM sightings AS s
+                    WHERE s.ssid = networks.ssid AND s.bssid = networks.bssid
+                      AND s.resolution = ? AND s.bucket < ?
+                )
+                """,
+                (SECONDS_PER_DAY, daily_cutoff, SECONDS_PER_DAY, daily_cutoff),
+            )
+            self._conn.execute(
+                "DELETE FROM sightings WHERE resolution = ? AND bucket < ?",
+                (SECONDS_PER_DAY, daily_cutoff),
+            )
+            self._conn.execute(
+                "DELETE FROM networks WHERE last_seen < ?", (daily_cutoff,)
+            )
+            self._conn.execute(
+                """
+                DELETE FROM sightings WHERE NOT EXISTS (
+                    SELECT 1 FROM networks AS n
+                    WHERE n.ssid = sightings.ssid AND n.bssid = sightings.bssid
+                )
+                """
+            )
+        self._last_compaction = now
+
+    def sightings(self, ssid, bssid):
+        """
+        Return a network's sighting buckets, oldest first.
+
+        Returns:
+            list: (bucket_start, resolution_seconds, count) tuples
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT bucket, resolution, count FROM sightings "
+                "WHERE ssid = ? AND bssid = ? ORDER BY bucket, resolution DESC",
+                (ssid, bssid),
+            ).fetchall()
+
+    def get(self, ssid, bssid):
+        """Return the history entry for a network, or None if it was never seen."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen, last_seen, seen_count, active_days FROM networks "
+                "WHERE ssid = ? AND bssid = ?",
+                (ssid, bssid),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._make_entry(ssid, bssid, *row)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _make_entry(ssid, bssid, first_seen, last_seen, seen_count, active_days):
+        """
+        Build the history entry dict returned to callers.
+
+        days_active counts the days a network was seen on after its first
+        one, so a new network shows 0 and one seen every day since it
+        appeared shows the days between its first and last sighting.
+        """
+        days_active = active_days - 1
+        return {
+            "ssid": ssid,
+            "bssid": bssid,
+            "first_seen": format_timestamp(first_seen),
+            "last_seen": format_timestamp(last_seen),
+            "seen_count": seen_count,
+            "stability": "New" if seen_count == 1 else get_stability_label(days_active),
+            "days_active": days_active,
+        }
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_history_store():
+    """Return the shared history store, opening it on first use."""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = HistoryStore()
+    return _default_store
+
+
+def close_history_store():
+    """Close the shared history store; the next get_history_store() reopens it."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is not None:
+            _default_store.close()
+            _default_store = None
@@ -1,10 +1,10 @@
 """Main entry point for WiFi Password Tester."""
 
+import atexit
+import os
 import sys
 import time
-from .scanner import scan_networks, select_network, get_network_details
-from .connector import try_password
-from .wps_attack import wps_attack, show_wps_info
+from . import timing
 from .utils import (
     print_banner,
     get_password_source,
@@ -17,6 +17,9 @@ from .utils import (
 
 def attack_single_network(iface, network, passwords):
     """Attack a single network with given passwords."""
+    from .connector import try_password
+    from .scanner import get_network_details
+
     ssid_display = get_ssid_display(network)
     details = get_network_details(network)
     
@@ -44,7 +47,7 @@ def attack_single_network(iface, network, passwords):
             print(f"{Colors.GREEN}{'═' * 68}{Colors.RESET}")
             
             # Save to cracked.json
-            save_cracked_password(ssid_display, pw, details['signal'], details['akm'], elapsed, idx)
+            save_cracked_password(ssid_display, pw, details.signal, details.akm, elapsed, idx)
             return True
         else:
             print(f" {Colors.RED}[✗ FAILED]{Colors.RESET}")
@@ -95,11 +98,28 @@ def attack_all_networks(iface, networks, passwords):
     print(f"{Colors.CYAN}{'═' * 68}{Colors.RESET}")
 
 
+def _write_timings(path):
+    """Write the stage timing summary when the tool exits."""
+    summary = timing.disable()
+    if summary is not None:
+        timing.write_summary(path, summary)
+
+
 def main():
     """Main function to run the WiFi password tester."""
+    # Opt-in stage timings (and cProfile stats) for the scan/display cycles
+    timings_path = os.environ.get("WIFI_NETHUNTER_TIMINGS")
+    if timings_path:
+        timing.enable(profile_path=os.environ.get("WIFI_NETHUNTER_PROFILE"))
+        atexit.register(_write_timings, timings_path)
+
     print_banner()
 
     try:
+        # Deferred so the banner shows before pywifi and the scanner load
+        from .scanner import scan_networks, select_network, get_network_details
+        from .wps_attack import wps_attack, show_wps_info
+
         # Scan for networks
         networks, iface, mode = scan_networks()
 
@@ -113,7 +133,7 @@ def main():
             print(f"{Colors.CYAN}{'─' * 68}{Colors.RESET}")
 
             # Check if WPS is available
-            if details['wps_enabled'] and not details['wps_locked']:
+            if details.wps_enabled and not details.wps_locked:
                 print(f"\n{Colors.YELLOW}[!] WPS detected on this network!{Colors.RESET}")
                 print(f"{Colors.CYAN}{'─' * 68}{Colors.RESET}")
                 print(f"{Colors.WHITE}Attack options:{Colors.RESET}")
@@ -126,9 +146,9 @@ def main():
                 
                 if attack_choice == '1':
                     # WPS PIN Attack
-                    success, pin, password = wps_attack(iface, network, details['vendor'])
+                    success, pin, password = wps_attack(iface, network, details.vendor)
                     if success:
-                        save_cracked_password(ssid_display, pin, details['signal'], details['akm'], 0, 1)
+                        save_cracked_password(ssid_display, pin, details.signal, details.akm, 0, 1)
                     return
                 elif attack_choice == '3':
                     show_wps_info()
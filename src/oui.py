@@ -0,0 +1,178 @@
+"""IEEE OUI registry (MA-L / MA-M / MA-S) loaded into a prefix index."""
+
+import csv
+import struct
+import sys
+from pathlib import Path
+
+
+# Prebuilt registry shipped next to the wordlists (relative to the working
+# directory, falling back to the copy next to the src package)
+OUI_REGISTRY_FILE = "data/oui.bin"
+_BUNDLED_REGISTRY_FILE = Path(__file__).resolve().parent.parent / OUI_REGISTRY_FILE
+
+# Prefix lengths in bits for each IEEE registry
+REGISTRY_BITS = {
+    "MA-L": 24,
+    "MA-M": 28,
+    "MA-S": 36,
+}
+
+# Longest prefix first, so MA-S/MA-M blocks win over the MA-L they belong to
+PREFIX_BITS = (36, 28, 24)
+
+# Binary format: header, newline-separated vendor names, fixed-size records
+_MAGIC = b"OUI1"
+_HEADER = struct.Struct("<4sII")   # magic, record count, names length
+_RECORD = struct.Struct("<QBI")    # prefix, prefix bits, vendor name index
+
+
+def mac_to_int(mac_address):
+    """Convert a MAC address string to a 48-bit integer, or None if invalid."""
+    digits = mac_address.replace(":", "").replace("-", "").replace(".", "").strip()
+    if len(digits) < 12:
+        return None
+    try:
+        return int(digits[:12], 16)
+    except ValueError:
+        return None
+
+
+class OUIRegistry:
+    """Prefix index over 24-, 28- and 36-bit MAC address assignments."""
+
+    def __init__(self):
+        self._prefixes = {bits: {} for bits in PREFIX_BITS}
+
+    def __len__(self):
+        return sum(len(table) for table in self._prefixes.values())
+
+    def add(self, prefix, bits, vendor_name):
+        """
+        Add an assignment to the index.
+
+        Args:
+            prefix (int): The assigned prefix (bits long)
+            bits (int): Prefix length, one of 24, 28 or 36
+            vendor_name (str): Organization name
+        """
+        self._prefixes[bits][prefix] = vendor_name
+
+    def lookup(self, mac_value):
+        """Return the vendor for a 48-bit MAC integer, or None if unassigned."""
+        for bits in PREFIX_BITS:
+            vendor = self._prefixes[bits].get(mac_value >> (48 - bits))
+            if vendor is not None:
+                return vendor
+        return None
+
+    def items(self):
+        """Yield (prefix, bits, vendor_name) for every assignment."""
+        for bits, table in self._prefixes.items():
+            for prefix, vendor_name in table.items():
+                yield prefix, bits, vendor_name
+
+    def load_csv(self, path):
+        """Load an IEEE registry CSV (Registry,Assignment,Organization Name,...)."""
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                bits = REGISTRY_BITS.get(row.get("Registry", "").strip())
+                assignment = row.get("Assignment", "").strip()
+                name = " ".join(row.get("Organization Name", "").split())
+                if bits is None or not name or len(assignment) * 4 != bits:
+                    continue
+                try:
+                    self.add(int(assignment, 16), bits, name)
+                except ValueError:
+                    continue
+        return self
+
+    def load_binary(self, path):
+        """Load a registry previously written by save_binary."""
+        data = Path(path).read_bytes()
+        magic, count, names_length = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an OUI registry file")
+
+        offset = _HEADER.size
+        names = data[offset:offset + names_length].decode("utf-8").split("\n")
+        offset += names_length
+        records = data[offset:offset + count * _RECORD.size]
+
+        prefixes = self._prefixes
+        for prefix, bits, name_index in _RECORD.iter_unpack(records):
+            prefixes[bits][prefix] = names[name_index]
+        return self
+
+    def save_binary(self, path):
+        """Write the index in the compact binary form loaded by load_binary."""
+        name_index = {}
+        records = []
+        for prefix, bits, vendor_name in self.items():
+            index = name_index.setdefault(vendor_name, len(name_index))
+            records.append(_RECORD.pack(prefix, bits, index))
+
+        names = "\n".join(name_index).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(records), len(names)))
+            f.write(names)
+            f.write(b"".join(records))
+
+
+def load_oui_registry(path):
+    """Load a registry from a prebuilt binary file or an IEEE CSV export."""
+    registry = OUIRegistry()
+    if str(path).lower().endswith(".csv"):
+        return registry.load_csv(path)
+    return registry.load_binary(path)
+
+
+_registry = None
+
+
+def get_oui_registry():
+    """
+    Return the shared registry, loading data/oui.bin on first use (empty if missing).
+
+    The file is read and unpacked into per-prefix-length dicts once (about
+    50 ms for the full registry); lookups are then plain dict hits.
+    """
+    global _registry
+    if _registry is None:
+        registry = OUIRegistry()
+        path = Path(OUI_REGISTRY_FILE)
+        if not path.exists():
+            path = _BUNDLED_REGISTRY_FILE
+        if path.exists():
+            try:
+                registry.load_binary(path)
+            except (OSError, ValueError, struct.error):
+                registry = OUIRegistry()
+        _registry = registry
+    return _registry
+
+
+def main(argv=None):
+    """Build data/oui.bin from IEEE MA-L, MA-M and MA-S CSV exports."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.oui",
+        description="Build the prebuilt OUI registry from IEEE CSV exports "
+                    "(oui.csv, mam.csv, oui36.csv).",
+    )
+    parser.add_argument("csv_files", nargs="+", help="IEEE registry CSV files")
+    parser.add_argument("-o", "--output", default=OUI_REGISTRY_FILE,
+                        help=f"output file (default: {OUI_REGISTRY_FILE})")
+    args = parser.parse_args(argv)
+
+    registry = OUIRegistry()
+    for csv_file in args.csv_files:
+        registry.load_csv(csv_file)
+    registry.save_binary(args.output)
+    print(f"Wrote {len(registry)} assignments to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,58 +1,162 @@
 """Network scanning functionality."""
 
-import pywifi
 from pywifi import const
 import time
+import shutil
 import sys
-import json
-from pathlib import Path
-from datetime import datetime
-from .utils import Colors, check_if_cracked
-from .vendors import get_vendor_from_mac
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from .backends import get_backend
+from .frequencies import get_wifi_band, get_channel_from_freq, lookup_frequency
+from . import timing
+from .utils import Colors, cosmetic_pause, load_cracked_networks
 from .wps_attack import get_wps_info
 
 
-def scan_networks_once(iface):
-    """Perform a single network scan and return results."""
-    try:
-        # Disconnect from current network before scanning
-        iface.disconnect()
-        time.sleep(1)
+class NetworkDetails(namedtuple("NetworkDetails", [
+    "ssid", "signal", "signal_quality", "distance", "bssid", "vendor",
+    "frequency", "band", "channel", "stability", "days_active", "seen_count",
+    "auth", "akm", "cipher", "security_rating", "attack_difficulty",
+    "wps_enabled", "wps_locked", "wps_version", "interface",
+])):
+    """Immutable, compact record of everything shown about a scanned network."""
+    __slots__ = ()
+
+
+# Scan completion polling (seconds)
+SCAN_POLL_INITIAL = 0.25
+SCAN_POLL_MAX = 0.5
+SCAN_STABLE_WINDOW = 0.5
+SCAN_TIMEOUT = 8.0
+SCAN_EMPTY_TIMEOUT = 3.0  # give up earlier when the area stays empty
+DISCONNECT_TIMEOUT = 1.0
+
+# Gone rows tolerated in the live table before it is compacted
+LIVE_TABLE_MIN_COMPACT = 50
+
+# Per-scan cache of extracted details: id(network) -> (network, NetworkDetails)
+_details_cache = {}
+
+
+def wait_for_disconnect(iface, timeout=DISCONNECT_TIMEOUT):
+    """Poll the interface until it reports disconnected (or the timeout passes)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if iface.status() in (const.IFACE_DISCONNECTED, const.IFACE_INACTIVE):
+                return True
+        except Exception:
+            pass
+        time.sleep(SCAN_POLL_INITIAL)
+    return False
+
+
+def wait_for_scan_results(iface, timeout=SCAN_TIMEOUT, stable_window=SCAN_STABLE_WINDOW, verbose=True):
+    """
+    Poll scan results with backoff until they stop changing.
+
+    Results count as complete once the interface is no longer scanning and
+    the set of (BSSID, signal) pairs has stayed the same for stable_window
+    seconds. An empty result set only counts as complete after
+    SCAN_EMPTY_TIMEOUT, since drivers may report nothing early in a scan.
+    Whatever is available is returned when the timeout passes.
+    """
+    start = time.monotonic()
+    delay = SCAN_POLL_INITIAL
+    signature = None
+    stable_since = start
+    results = []
+    polls = 0
+
+    while True:
+        with timing.stage("scan.sleep"):
+            time.sleep(delay)
+        polls += 1
+        if verbose:
+            print(f"{Colors.CYAN}    Scanning{'.' * polls}{Colors.RESET}")
 
+        with timing.stage("scan.results"):
+            results = iface.scan_results() or []
+        now = time.monotonic()
+
+        try:
+            scanning = iface.status() == const.IFACE_SCANNING
+        except Exception:
+            scanning = False
+
+        current = frozenset((getattr(r, 'bssid', None), r.signal) for r in results)
+        if scanning or current != signature:
+            signature = current
+            stable_since = now
+        elif now - stable_since >= stable_window and (current or now - start >= SCAN_EMPTY_TIMEOUT):
+            return results
+
+        if now - start >= timeout:
+            return results
+
+        delay = min(delay * 2, SCAN_POLL_MAX)
+
+
+def collect_scan_results(iface, verbose=True, disconnect=True, per_bssid=False):
+    """
+    Run a scan on one interface and return the filtered results.
+
+    Unlike scan_networks_once this does not touch the per-scan details
+    cache, so it is safe to run on several interfaces at once.
+    """
+    # Disconnect from current network before scanning
+    if disconnect:
+        with timing.stage("scan.disconnect"):
+            iface.disconnect()
+            wait_for_disconnect(iface)
+
+    if verbose:
         print(f"{Colors.YELLOW}[*] Initiating network scan...{Colors.RESET}")
+    with timing.stage("scan.trigger"):
         iface.scan()
-        
-        # Animated scanning
-        for i in range(3):
-            time.sleep(1)
-            print(f"{Colors.CYAN}    Scanning{'.' * (i + 1)}{Colors.RESET}")
-        
-        results = iface.scan_results()
+    
+    with timing.stage("scan.wait"):
+        results = wait_for_scan_results(iface, verbose=verbose)
 
-        if not results:
+    if not results:
+        if verbose:
             print(f"{Colors.RED}[✗] No networks found.{Colors.RESET}")
-            return []
+        return []
 
-        networks = []
-        seen_ssids = set()
+    networks = []
+    seen = set()
 
+    with timing.stage("scan.filter"):
         for network in results:
-            # Convert SSID to string if it's bytes
-            try:
-                if isinstance(network.ssid, bytes):
-                    ssid_str = network.ssid.decode("utf-8", errors="ignore")
-                else:
-                    ssid_str = str(network.ssid)
-            except:
-                ssid_str = str(network.ssid)
+            ssid_str = decode_ssid(network)
 
-            # Skip duplicate SSIDs and empty SSIDs
-            if ssid_str in seen_ssids or not ssid_str:
+            # Skip duplicates (by SSID, or by access point); hidden (empty)
+            # SSIDs are only kept when listing every access point
+            key = (ssid_str, get_bssid(network)) if per_bssid else ssid_str
+            if key in seen or not (ssid_str or per_bssid):
                 continue
 
-            seen_ssids.add(ssid_str)
+            seen.add(key)
             networks.append(network)
 
+    return networks
+
+
+def scan_networks_once(iface, verbose=True, disconnect=True, per_bssid=False):
+    """
+    Perform a single network scan and return results.
+
+    With verbose=False the progress messages are suppressed (used by the
+    continuous survey, which reports only changes). With disconnect=False
+    the scan runs without first dropping the current connection. By default
+    only one access point is kept per SSID; per_bssid=True keeps every
+    access point (see group_by_ssid).
+    """
+    try:
+        with timing.cycle("scan"):
+            networks = collect_scan_results(iface, verbose, disconnect, per_bssid)
+            with timing.stage("scan.details"):
+                cache_scan_details(networks)
         return networks
 
     except Exception as e:
@@ -60,6 +164,70 @@ def scan_networks_once(iface):
         return []
 
 
+def scan_interfaces(ifaces, band_filters=None, verbose=False, disconnect=False, errors=None):
+    """
+    Scan on several interfaces at the same time and merge the results.
+
+    Each interface scans in its own worker thread; a single interface, or
+    every interface while profiling (cProfile only follows the thread that
+    enabled it), is scanned in the calling thread. Results are merged per
+    access point, keeping the sighting with the strongest signal and the
+    name of the interface that reported it (NetworkDetails.interface).
+
+    Args:
+        ifaces (list): Interfaces to scan with
+        band_filters (dict): Optional interface name -> band ("2.4", "5" or
+            "6") to pin an adapter to one band; its other results are ignored
+        verbose (bool): Print per-interface progress (and scan errors)
+        disconnect (bool): Disconnect each interface before scanning
+        errors (dict): If given, filled with interface name -> exception
+            for every interface whose scan failed
+
+    Returns:
+        list: Merged networks, one per (SSID, BSSID)
+    """
+    band_filters = band_filters or {}
+
+    def scan(iface):
+        name = iface.name()
+        try:
+            networks = collect_scan_results(iface, verbose, disconnect, per_bssid=True)
+        except Exception as e:
+            if errors is not None:
+                errors[name] = e
+            if verbose:
+                print(f"{Colors.RED}[✗] Error during network scan on {name}: {e}{Colors.RESET}")
+            return name, []
+        band = band_filters.get(name)
+        if band:
+            networks = [n for n in networks
+                        if lookup_frequency(getattr(n, 'freq', 0))[0].split(" ")[0] == band]
+        return name, networks
+
+    best = {}
+    sources = {}
+
+    def merge(results):
+        for name, networks in results:
+            for network in networks:
+                key = (decode_ssid(network), get_bssid(network))
+                current = best.get(key)
+                if current is None or network.signal > current.signal:
+                    best[key] = network
+                    sources[key] = name
+
+    if len(ifaces) <= 1 or timing.is_profiling():
+        merge(scan(iface) for iface in ifaces)
+    else:
+        with ThreadPoolExecutor(max_workers=len(ifaces)) as pool:
+            merge(pool.map(scan, ifaces))
+
+    merged = list(best.values())
+    with timing.stage("scan.details"):
+        cache_scan_details(merged, sources)
+    return merged
+
+
 def get_signal_quality(signal_dbm):
     """Convert signal strength from dBm to quality percentage."""
     if signal_dbm >= -50:
@@ -119,133 +287,51 @@ def get_attack_difficulty(signal, security_rating):
         return "Unknown"
 
 
-def get_wifi_band(freq):
-    """Determine WiFi band from frequency."""
-    if freq is None or freq == 0:
-        return "Unknown"
-    
-    # Convert kHz to MHz if needed
-    if freq > 100000:
-        freq = freq // 1000
-    
-    if 2400 <= freq <= 2500:
-        return "2.4 GHz"
-    elif 5000 <= freq <= 6000:
-        return "5 GHz"
-    elif 6000 <= freq <= 7125:
-        return "6 GHz (WiFi 6E)"
-    else:
-        return "Unknown"
-
+def track_network_stability(ssid, bssid):
+    """Track network appearance history for stability analysis."""
+    return track_scan_stability([(ssid, bssid)]).get((ssid, bssid), {
+        "stability": "Unknown",
+        "days_active": 0,
+        "seen_count": 1
+    })
 
-def get_channel_from_freq(freq):
-    """Convert frequency to WiFi channel number."""
-    if freq is None or freq == 0:
-        return "Unknown"
-    
-    # Convert kHz to MHz if needed
-    if freq > 100000:
-        freq = freq // 1000
-    
-    # 2.4 GHz channels (1-14)
-    if 2412 <= freq <= 2484:
-        if freq == 2484:
-            return 14
-        else:
-            return (freq - 2407) // 5
-    
-    # 5 GHz channels
-    elif 5170 <= freq <= 5825:
-        # Common 5GHz channels
-        channel_map = {
-            5180: 36, 5200: 40, 5220: 44, 5240: 48,
-            5260: 52, 5280: 56, 5300: 60, 5320: 64,
-            5500: 100, 5520: 104, 5540: 108, 5560: 112,
-            5580: 116, 5600: 120, 5620: 124, 5640: 128,
-            5660: 132, 5680: 136, 5700: 140, 5720: 144,
-            5745: 149, 5765: 153, 5785: 157, 5805: 161, 5825: 165
-        }
-        return channel_map.get(freq, (freq - 5000) // 5)
-    
-    return "Unknown"
 
+def track_scan_stability(networks):
+    """Record a whole scan's (ssid, bssid) pairs in one history transaction."""
+    from .history import get_history_store
 
-def track_network_stability(ssid, bssid):
-    """Track network appearance history for stability analysis."""
     try:
-        history_file = Path("network_history.json")
-        
-        # Load existing history
-        if history_file.exists():
-            with open(history_file, "r", encoding="utf-8") as f:
-                history = json.load(f)
-        else:
-            history = {"networks": {}}
-        
-        # Create unique key
-        key = f"{ssid}_{bssid}"
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        if key in history["networks"]:
-            # Update existing entry
-            network = history["networks"][key]
-            network["last_seen"] = current_time
-            network["seen_count"] = network.get("seen_count", 1) + 1
-            
-            # Calculate stability
-            first_seen = datetime.strptime(network["first_seen"], "%Y-%m-%d %H:%M:%S")
-            last_seen = datetime.strptime(current_time, "%Y-%m-%d %H:%M:%S")
-            days_active = (last_seen - first_seen).days
-            
-            if days_active > 7:
-                stability = "Very Stable"
-            elif days_active > 3:
-                stability = "Stable"
-            elif days_active > 1:
-                stability = "Moderate"
-            else:
-                stability = "New/Transient"
-            
-            network["stability"] = stability
-            network["days_active"] = days_active
-        else:
-            # New entry
-            history["networks"][key] = {
-                "ssid": ssid,
-                "bssid": bssid,
-                "first_seen": current_time,
-                "last_seen": current_time,
-                "seen_count": 1,
-                "stability": "New",
-                "days_active": 0
-            }
-        
-        # Save history
-        with open(history_file, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=4, ensure_ascii=False)
-        
-        return history["networks"][key]
-        
+        return get_history_store().record_sightings(networks)
     except Exception as e:
-        return {
-            "stability": "Unknown",
-            "days_active": 0,
-            "seen_count": 1
-        }
+        return {}
 
 
-def get_network_details(network):
-    """Extract detailed information about a network."""
-    details = {}
-    
-    # SSID
+def decode_ssid(network):
+    """Return the network SSID as a string."""
     try:
         if isinstance(network.ssid, bytes):
-            details['ssid'] = network.ssid.decode("utf-8", errors="ignore")
-        else:
-            details['ssid'] = str(network.ssid)
+            return network.ssid.decode("utf-8", errors="ignore")
+        return str(network.ssid)
     except:
-        details['ssid'] = str(network.ssid)
+        return str(network.ssid)
+
+
+def get_bssid(network):
+    """Return the network BSSID, or "Unknown" if it is not reported."""
+    try:
+        if hasattr(network, 'bssid'):
+            return network.bssid if network.bssid else "Unknown"
+        return "Unknown"
+    except:
+        return "Unknown"
+
+
+def _build_network_details(network, stability_info, vendor, interface=None):
+    """Extract detailed information about a network into a NetworkDetails record."""
+    details = {}
+    
+    # SSID
+    details['ssid'] = decode_ssid(network)
     
     # Signal strength
     details['signal'] = network.signal
@@ -253,23 +339,16 @@ def get_network_details(network):
     details['distance'] = get_estimated_distance(network.signal)
     
     # BSSID (MAC Address)
-    try:
-        if hasattr(network, 'bssid'):
-            details['bssid'] = network.bssid if network.bssid else "Unknown"
-        else:
-            details['bssid'] = "Unknown"
-    except:
-        details['bssid'] = "Unknown"
+    details['bssid'] = get_bssid(network)
     
     # Vendor identification
-    details['vendor'] = get_vendor_from_mac(details['bssid'])
+    details['vendor'] = vendor
     
     # Frequency and Channel
     try:
         if hasattr(network, 'freq') and network.freq:
             details['frequency'] = network.freq
-            details['band'] = get_wifi_band(network.freq)
-            details['channel'] = get_channel_from_freq(network.freq)
+            details['band'], details['channel'] = lookup_frequency(network.freq)
         else:
             details['frequency'] = 0
             details['band'] = "Unknown"
@@ -280,7 +359,6 @@ def get_network_details(network):
         details['channel'] = "Unknown"
     
     # Network stability tracking
-    stability_info = track_network_stability(details['ssid'], details['bssid'])
     details['stability'] = stability_info.get('stability', 'Unknown')
     details['days_active'] = stability_info.get('days_active', 0)
     details['seen_count'] = stability_info.get('seen_count', 1)
@@ -400,129 +478,398 @@ def get_network_details(network):
     details['wps_locked'] = wps_info['locked']
     details['wps_version'] = wps_info['version']
     
-    return details
+    # Interface that reported the network (multi-interface scans)
+    details['interface'] = interface
+    
+    return NetworkDetails(**details)
+
+
+def get_scan_details(networks, sources=None):
+    """
+    Return the NetworkDetails records for a list of scanned networks.
+
+    Records are served from the per-scan cache; networks that are not cached
+    yet are extracted together, with their history recorded in one transaction
+    and their vendors resolved in one batch. sources optionally maps
+    (ssid, bssid) to the name of the interface that reported the network.
+    """
+    missing = [n for n in networks if _cached_details(n) is None]
+    if missing:
+        # The vendor table is only loaded once there is something to look up
+        from .vendors import get_vendors_for_macs
+
+        sources = sources or {}
+        keys = [(decode_ssid(n), get_bssid(n)) for n in missing]
+        with timing.stage("details.history"):
+            stability = track_scan_stability(keys)
+        with timing.stage("details.vendors"):
+            vendors = get_vendors_for_macs(bssid for _, bssid in keys)
+        with timing.stage("details.build"):
+            for network, key in zip(missing, keys):
+                details = _build_network_details(
+                    network, stability.get(key, {}), vendors[key[1]], sources.get(key)
+                )
+                # Keep a reference to the network so its id() can't be reused
+                _details_cache[id(network)] = (network, details)
+    return [_details_cache[id(n)][1] for n in networks]
 
 
-def display_networks(networks, detailed=False):
-    """Display the list of networks in a formatted table."""
+def cache_scan_details(networks, sources=None):
+    """Replace the per-scan details cache with records for a fresh scan."""
+    _details_cache.clear()
+    return get_scan_details(networks, sources)
+
+
+def get_network_details(network):
+    """Extract detailed information about a network (cached per scan)."""
+    return get_scan_details([network])[0]
+
+
+def _cached_details(network):
+    """Return the cached NetworkDetails for a network, or None."""
+    entry = _details_cache.get(id(network))
+    if entry is not None and entry[0] is network:
+        return entry[1]
+    return None
+
+
+# Group name for access points that don't broadcast their SSID
+HIDDEN_SSID_LABEL = "<hidden>"
+
+
+class SSIDGroup:
+    """All access points seen for one SSID, with running aggregates."""
+
+    __slots__ = ("ssid", "access_points", "best", "channels", "band_mix")
+
+    def __init__(self, ssid):
+        self.ssid = ssid
+        self.access_points = []
+        self.best = None      # strongest access point
+        self.channels = set()  # (band, channel) pairs
+        self.band_mix = {}    # band -> number of access points
+
+    def add(self, details):
+        """Add an access point's NetworkDetails to the group."""
+        self.access_points.append(details)
+        if self.best is None or details.signal > self.best.signal:
+            self.best = details
+        if details.channel != "Unknown":
+            self.channels.add((details.band, details.channel))
+        self.band_mix[details.band] = self.band_mix.get(details.band, 0) + 1
+
+    @property
+    def channel_spread(self):
+        """
+        Sorted (band, channel) pairs the SSID's access points use.
+
+        Channel numbers repeat across bands (2.4 and 6 GHz both have a
+        channel 1), so each channel is kept with its band.
+        """
+        return sorted(self.channels)
+
+
+def group_by_ssid(scan_details):
+    """
+    Group a scan's access points under their SSIDs in a single pass.
+
+    Access points with a hidden (empty) SSID are grouped under
+    HIDDEN_SSID_LABEL.
+
+    Args:
+        scan_details (list): NetworkDetails records (one per access point)
+
+    Returns:
+        list: SSIDGroup objects, strongest best access point first
+    """
+    groups = {}
+    for details in scan_details:
+        ssid = details.ssid or HIDDEN_SSID_LABEL
+        group = groups.get(ssid)
+        if group is None:
+            group = groups[ssid] = SSIDGroup(ssid)
+        group.add(details)
+    return sorted(groups.values(), key=lambda g: g.best.signal, reverse=True)
+
+
+def display_ssid_groups(groups):
+    """Display access points grouped by SSID."""
+    total = sum(len(group.access_points) for group in groups)
     print(f"\n{Colors.CYAN}{'═' * 110}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.WHITE}[*] AVAILABLE TARGETS: {Colors.CYAN}{len(networks)}{Colors.WHITE} networks found{Colors.RESET}")
+    print(f"{Colors.BOLD}{Colors.WHITE}[*] ACCESS POINTS: {Colors.CYAN}{total}{Colors.WHITE} "
+          f"across {Colors.CYAN}{len(groups)}{Colors.WHITE} SSIDs{Colors.RESET}")
     print(f"{Colors.CYAN}{'═' * 110}{Colors.RESET}")
 
+    for group in groups:
+        best = group.best
+        by_band = {}
+        for band, channel in group.channel_spread:
+            by_band.setdefault(band.split(" ")[0], []).append(str(channel))
+        channels = '; '.join(f"{', '.join(chans)} ({band} GHz)"
+                             for band, chans in by_band.items()) or "Unknown"
+        bands = ', '.join(f"{band} ×{count}" for band, count in group.band_mix.items())
+        print(f"{Colors.BOLD}{Colors.WHITE}{group.ssid}{Colors.RESET} "
+              f"{Colors.CYAN}({len(group.access_points)} APs){Colors.RESET}")
+        print(f"    {Colors.WHITE}Best:{Colors.RESET} {Colors.MAGENTA}{best.bssid}{Colors.RESET} "
+              f"{Colors.GREEN}{best.signal} dBm{Colors.RESET} │ "
+              f"{Colors.WHITE}Channels:{Colors.RESET} {Colors.CYAN}{channels}{Colors.RESET} │ "
+              f"{Colors.WHITE}Bands:{Colors.RESET} {Colors.MAGENTA}{bands}{Colors.RESET}")
+
+    print(f"{Colors.CYAN}{'═' * 110}{Colors.RESET}")
+
+
+def format_network_detailed(idx, details, cracked_info=None):
+    """Render one network of the detailed view as a list of lines."""
+    lines = []
+
+    # Color code signal strength
+    if details.signal > -50:
+        signal_color = Colors.GREEN
+        quality_color = Colors.GREEN
+    elif details.signal > -70:
+        signal_color = Colors.YELLOW
+        quality_color = Colors.YELLOW
+    else:
+        signal_color = Colors.RED
+        quality_color = Colors.RED
+    
+    # Color code security rating
+    if details.security_rating == "Strong":
+        security_color = Colors.GREEN
+    elif details.security_rating == "Medium":
+        security_color = Colors.YELLOW
+    elif details.security_rating == "Weak":
+        security_color = Colors.RED
+    else:
+        security_color = Colors.WHITE
+    
+    # Color code attack difficulty
+    if details.attack_difficulty == "Easy":
+        difficulty_color = Colors.GREEN
+    elif details.attack_difficulty == "Medium":
+        difficulty_color = Colors.YELLOW
+    elif details.attack_difficulty == "Hard":
+        difficulty_color = Colors.RED
+    else:
+        difficulty_color = Colors.WHITE
+    
+    cracked_status = f" {Colors.GREEN}[✓ CRACKED]{Colors.RESET}" if cracked_info else ""
+    
+    # Color code stability
+    if details.stability in ["Very Stable", "Stable"]:
+        stability_color = Colors.GREEN
+    elif details.stability == "Moderate":
+        stability_color = Colors.YELLOW
+    else:
+        stability_color = Colors.WHITE
+    
+    lines.append(f"{Colors.CYAN}[{idx}]{Colors.RESET} {Colors.BOLD}{Colors.WHITE}{details.ssid or HIDDEN_SSID_LABEL}{Colors.RESET}{cracked_status}")
+    lines.append(f"    {Colors.WHITE}Signal:{Colors.RESET} {signal_color}{details.signal} dBm{Colors.RESET} "
+                 f"({quality_color}{details.signal_quality}%{Colors.RESET}) │ "
+                 f"{Colors.WHITE}Distance:{Colors.RESET} {Colors.CYAN}~{details.distance}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Band:{Colors.RESET} {Colors.MAGENTA}{details.band}{Colors.RESET}")
+    lines.append(f"    {Colors.WHITE}Channel:{Colors.RESET} {Colors.CYAN}{details.channel}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Security:{Colors.RESET} {Colors.YELLOW}{details.akm}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Cipher:{Colors.RESET} {Colors.CYAN}{details.cipher}{Colors.RESET}")
+    lines.append(f"    {Colors.WHITE}Rating:{Colors.RESET} {security_color}{details.security_rating}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Difficulty:{Colors.RESET} {difficulty_color}{details.attack_difficulty}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Vendor:{Colors.RESET} {Colors.BLUE}{details.vendor}{Colors.RESET}")
+    lines.append(f"    {Colors.WHITE}BSSID:{Colors.RESET} {Colors.MAGENTA}{details.bssid}{Colors.RESET}")
+    lines.append(f"    {Colors.WHITE}Stability:{Colors.RESET} {stability_color}{details.stability}{Colors.RESET} │ "
+                 f"{Colors.WHITE}Active:{Colors.RESET} {Colors.CYAN}{details.days_active} days{Colors.RESET} │ "
+                 f"{Colors.WHITE}Seen:{Colors.RESET} {Colors.CYAN}{details.seen_count}x{Colors.RESET}")
+    
+    # WPS status
+    if details.wps_enabled:
+        wps_status = f"{Colors.RED}LOCKED{Colors.RESET}" if details.wps_locked else f"{Colors.GREEN}ENABLED{Colors.RESET}"
+        lines.append(f"    {Colors.WHITE}WPS:{Colors.RESET} {wps_status} │ "
+                     f"{Colors.WHITE}Version:{Colors.RESET} {Colors.CYAN}{details.wps_version}{Colors.RESET} "
+                     f"{Colors.YELLOW}[⚡ WPS Attack Available]{Colors.RESET}")
+    
+    if cracked_info:
+        lines.append(f"    {Colors.GREEN}[✓] Password:{Colors.RESET} {Colors.WHITE}{cracked_info['password']}{Colors.RESET} │ "
+                     f"{Colors.GREEN}Cracked:{Colors.RESET} {Colors.CYAN}{cracked_info['cracked_at']}{Colors.RESET}")
+    
+    lines.append("")
+    return lines
+
+
+def format_network_compact(idx, details):
+    """Render one network of the compact view as a single line."""
+    # Color code signal strength
+    if details.signal > -50:
+        signal_color = Colors.GREEN
+    elif details.signal > -70:
+        signal_color = Colors.YELLOW
+    else:
+        signal_color = Colors.RED
+    
+    return (f"{Colors.CYAN}[{idx}]{Colors.RESET} {Colors.WHITE}{details.ssid or HIDDEN_SSID_LABEL:30}{Colors.RESET} │ "
+            f"{signal_color}{details.signal:4} dBm{Colors.RESET} │ "
+            f"{Colors.MAGENTA}{details.auth:10}{Colors.RESET} │ "
+            f"{Colors.YELLOW}{details.akm}{Colors.RESET}")
+
+
+def display_networks(networks, detailed=False):
+    """
+    Display the list of networks in a formatted table.
+
+    The whole table is rendered into one buffer and written with a single
+    call, so large scans are not bottlenecked on terminal writes.
+    """
+    with timing.cycle("display"):
+        with timing.stage("display.details"):
+            scan_details = get_scan_details(networks)
+        with timing.stage("display.format"):
+            lines = _format_network_table(scan_details, detailed)
+        with timing.stage("display.write"):
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+
+def _format_network_table(scan_details, detailed):
+    """Render the lines of the display_networks table."""
+    lines = [
+        "",
+        f"{Colors.CYAN}{'═' * 110}{Colors.RESET}",
+        f"{Colors.BOLD}{Colors.WHITE}[*] AVAILABLE TARGETS: {Colors.CYAN}{len(scan_details)}{Colors.WHITE} networks found{Colors.RESET}",
+        f"{Colors.CYAN}{'═' * 110}{Colors.RESET}",
+    ]
+
     if detailed:
         # Detailed view with all information
-        for idx, network in enumerate(networks):
-            details = get_network_details(network)
-            
-            # Color code signal strength
-            if details['signal'] > -50:
-                signal_color = Colors.GREEN
-                quality_color = Colors.GREEN
-            elif details['signal'] > -70:
-                signal_color = Colors.YELLOW
-                quality_color = Colors.YELLOW
-            else:
-                signal_color = Colors.RED
-                quality_color = Colors.RED
-            
-            # Color code security rating
-            if details['security_rating'] == "Strong":
-                security_color = Colors.GREEN
-            elif details['security_rating'] == "Medium":
-                security_color = Colors.YELLOW
-            elif details['security_rating'] == "Weak":
-                security_color = Colors.RED
-            else:
-                security_color = Colors.WHITE
-            
-            # Color code attack difficulty
-            if details['attack_difficulty'] == "Easy":
-                difficulty_color = Colors.GREEN
-            elif details['attack_difficulty'] == "Medium":
-                difficulty_color = Colors.YELLOW
-            elif details['attack_difficulty'] == "Hard":
-                difficulty_color = Colors.RED
-            else:
-                difficulty_color = Colors.WHITE
-            
-            # Check if already cracked
-            cracked_info = check_if_cracked(details['ssid'])
-            cracked_status = f" {Colors.GREEN}[✓ CRACKED]{Colors.RESET}" if cracked_info else ""
-            
-            # Color code stability
-            if details['stability'] in ["Very Stable", "Stable"]:
-                stability_color = Colors.GREEN
-            elif details['stability'] == "Moderate":
-                stability_color = Colors.YELLOW
-            else:
-                stability_color = Colors.WHITE
-            
-            print(f"{Colors.CYAN}[{idx}]{Colors.RESET} {Colors.BOLD}{Colors.WHITE}{details['ssid']}{Colors.RESET}{cracked_status}")
-            print(f"    {Colors.WHITE}Signal:{Colors.RESET} {signal_color}{details['signal']} dBm{Colors.RESET} "
-                  f"({quality_color}{details['signal_quality']}%{Colors.RESET}) │ "
-                  f"{Colors.WHITE}Distance:{Colors.RESET} {Colors.CYAN}~{details['distance']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Band:{Colors.RESET} {Colors.MAGENTA}{details['band']}{Colors.RESET}")
-            print(f"    {Colors.WHITE}Channel:{Colors.RESET} {Colors.CYAN}{details['channel']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Security:{Colors.RESET} {Colors.YELLOW}{details['akm']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Cipher:{Colors.RESET} {Colors.CYAN}{details['cipher']}{Colors.RESET}")
-            print(f"    {Colors.WHITE}Rating:{Colors.RESET} {security_color}{details['security_rating']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Difficulty:{Colors.RESET} {difficulty_color}{details['attack_difficulty']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Vendor:{Colors.RESET} {Colors.BLUE}{details['vendor']}{Colors.RESET}")
-            print(f"    {Colors.WHITE}BSSID:{Colors.RESET} {Colors.MAGENTA}{details['bssid']}{Colors.RESET}")
-            print(f"    {Colors.WHITE}Stability:{Colors.RESET} {stability_color}{details['stability']}{Colors.RESET} │ "
-                  f"{Colors.WHITE}Active:{Colors.RESET} {Colors.CYAN}{details['days_active']} days{Colors.RESET} │ "
-                  f"{Colors.WHITE}Seen:{Colors.RESET} {Colors.CYAN}{details['seen_count']}x{Colors.RESET}")
-            
-            # WPS status
-            if details['wps_enabled']:
-                wps_status = f"{Colors.RED}LOCKED{Colors.RESET}" if details['wps_locked'] else f"{Colors.GREEN}ENABLED{Colors.RESET}"
-                print(f"    {Colors.WHITE}WPS:{Colors.RESET} {wps_status} │ "
-                      f"{Colors.WHITE}Version:{Colors.RESET} {Colors.CYAN}{details['wps_version']}{Colors.RESET} "
-                      f"{Colors.YELLOW}[⚡ WPS Attack Available]{Colors.RESET}")
-            
-            if cracked_info:
-                print(f"    {Colors.GREEN}[✓] Password:{Colors.RESET} {Colors.WHITE}{cracked_info['password']}{Colors.RESET} │ "
-                      f"{Colors.GREEN}Cracked:{Colors.RESET} {Colors.CYAN}{cracked_info['cracked_at']}{Colors.RESET}")
-            
-            print()
+        cracked = load_cracked_networks()
+        for idx, details in enumerate(scan_details):
+            lines.extend(format_network_detailed(idx, details, cracked.get(details.ssid)))
     else:
         # Compact view
-        for idx, network in enumerate(networks):
-            details = get_network_details(network)
-            
-            # Color code signal strength
-            if details['signal'] > -50:
-                signal_color = Colors.GREEN
-            elif details['signal'] > -70:
-                signal_color = Colors.YELLOW
+        for idx, details in enumerate(scan_details):
+            lines.append(format_network_compact(idx, details))
+
+    lines.append(f"{Colors.CYAN}{'═' * 100}{Colors.RESET}")
+    return lines
+
+
+class LiveNetworkTable:
+    """
+    Compact network table that redraws in place.
+
+    Rows keep the order in which their BSSID first appeared. On every render
+    only the lines whose text changed are rewritten, using ANSI cursor
+    movement, and the whole update goes out in a single write. The table is
+    compacted (and fully redrawn) once most of its rows are gone networks,
+    or whenever it no longer fits on the screen.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._order = {}   # bssid -> row number
+        self._lines = []   # lines currently on screen (header + rows)
+
+    def render(self, scan_details):
+        """Render the latest records, redrawing only what changed."""
+        with timing.stage("display.live"):
+            self._render(scan_details)
+
+    def _render(self, scan_details):
+        current = {details.bssid: details for details in scan_details}
+
+        gone = len(self._order) - sum(1 for bssid in self._order if bssid in current)
+        full_redraw = not self._lines or gone > max(len(current), LIVE_TABLE_MIN_COMPACT)
+        if full_redraw:
+            # Renumber the surviving rows so they stay contiguous
+            survivors = [bssid for bssid in self._order if bssid in current]
+            self._order = {bssid: row for row, bssid in enumerate(survivors)}
+        for bssid in current:
+            if bssid not in self._order:
+                self._order[bssid] = len(self._order)
+
+        rows = [None] * len(self._order)
+        for bssid, row in self._order.items():
+            details = current.get(bssid)
+            if details is None:
+                rows[row] = f"{Colors.CYAN}[{row}]{Colors.RESET} {Colors.RED}{'(gone)':30}{Colors.RESET} │ {bssid}"
             else:
-                signal_color = Colors.RED
-            
-            print(f"{Colors.CYAN}[{idx}]{Colors.RESET} {Colors.WHITE}{details['ssid']:30}{Colors.RESET} │ "
-                  f"{signal_color}{details['signal']:4} dBm{Colors.RESET} │ "
-                  f"{Colors.MAGENTA}{details['auth']:10}{Colors.RESET} │ "
-                  f"{Colors.YELLOW}{details['akm']}{Colors.RESET}")
+                rows[row] = format_network_compact(row, details)
+
+        header = (f"{Colors.BOLD}{Colors.WHITE}[*] LIVE SURVEY: {Colors.CYAN}{len(current)}"
+                  f"{Colors.WHITE} networks in view │ {time.strftime('%H:%M:%S')}{Colors.RESET}")
+        lines = [header] + rows
 
-    print(f"{Colors.CYAN}{'═' * 100}{Colors.RESET}")
+        drawn = len(self._lines)
+        if full_redraw or max(drawn, len(lines)) >= shutil.get_terminal_size().lines:
+            # Lines above the top of the screen can't be reached; start over
+            buffer = ("\033[2J\033[H" if self._lines else "") + "\n".join(lines) + "\n"
+        else:
+            parts = []
+            for number, line in enumerate(lines):
+                if number >= drawn:
+                    parts.append(line + "\n")
+                elif self._lines[number] != line:
+                    # Jump up to the line, rewrite it, and come back down
+                    up = drawn - number
+                    parts.append(f"\033[{up}A\r{line}\033[K\033[{up}B\r")
+            buffer = "".join(parts)
+
+        self._lines = lines
+        self.stream.write(buffer)
+        self.stream.flush()
+
+
+def scan_all_interfaces(interfaces, per_bssid=False):
+    """
+    Interactive scan on every adapter.
+
+    A single adapter is scanned with scan_networks_once. With several, they
+    scan in parallel (scan_interfaces) and, unless per_bssid=True, only the
+    strongest access point of each SSID is kept.
+    """
+    if len(interfaces) == 1:
+        return scan_networks_once(interfaces[0], per_bssid=per_bssid)
+
+    # One progress line from here: verbose workers would interleave theirs
+    print(f"{Colors.YELLOW}[*] Initiating network scan on {len(interfaces)} interfaces...{Colors.RESET}")
+    errors = {}
+    with timing.cycle("scan"):
+        networks = scan_interfaces(interfaces, disconnect=True, errors=errors)
+    for name, e in errors.items():
+        print(f"{Colors.RED}[✗] Error during network scan on {name}: {e}{Colors.RESET}")
+    if not networks:
+        print(f"{Colors.RED}[✗] No networks found.{Colors.RESET}")
+    if per_bssid:
+        return networks
+
+    strongest = {}
+    for network in networks:
+        ssid = decode_ssid(network)
+        if not ssid:
+            continue
+        current = strongest.get(ssid)
+        if current is None or network.signal > current.signal:
+            strongest[ssid] = network
+    return list(strongest.values())
 
 
 def scan_networks():
     """Scan and return available WiFi networks with refresh option."""
     try:
-        wifi = pywifi.PyWiFi()
+        interfaces = get_backend().interfaces()
 
-        if not wifi.interfaces():
+        if not interfaces:
             print(f"{Colors.RED}[✗] Error: No WiFi interfaces found.{Colors.RESET}")
             sys.exit(1)
 
-        iface = wifi.interfaces()[0]
-        print(f"{Colors.GREEN}[✓] Interface:{Colors.RESET} {Colors.CYAN}{iface.name()}{Colors.RESET}")
+        # Every adapter scans; attacks run on the first one
+        iface = interfaces[0]
+        names = ", ".join(i.name() for i in interfaces)
+        label = "Interface" if len(interfaces) == 1 else "Interfaces"
+        print(f"{Colors.GREEN}[✓] {label}:{Colors.RESET} {Colors.CYAN}{names}{Colors.RESET}")
 
         networks = []
         
         while True:
             # Perform scan
-            networks = scan_networks_once(iface)
+            networks = scan_all_interfaces(interfaces)
             
             if not networks:
                 print(f"{Colors.YELLOW}[!] No networks found. Retrying...{Colors.RESET}")
@@ -537,8 +884,11 @@ def scan_networks():
             print(f"{Colors.GREEN}[R]{Colors.RESET} {Colors.WHITE}► Refresh network list{Colors.RESET}")
             print(f"{Colors.GREEN}[S]{Colors.RESET} {Colors.WHITE}► Select single target{Colors.RESET}")
             print(f"{Colors.GREEN}[A]{Colors.RESET} {Colors.WHITE}► Attack all networks (mass attack){Colors.RESET}")
+            print(f"{Colors.GREEN}[C]{Colors.RESET} {Colors.WHITE}► Continuous survey (report changes only){Colors.RESET}")
+            print(f"{Colors.GREEN}[L]{Colors.RESET} {Colors.WHITE}► Live survey table (redraws changed rows){Colors.RESET}")
+            print(f"{Colors.GREEN}[G]{Colors.RESET} {Colors.WHITE}► Show all access points grouped by SSID + channel report{Colors.RESET}")
             
-            choice = input(f"{Colors.MAGENTA}[?] Enter choice{Colors.RESET} {Colors.CYAN}[R/S/A]{Colors.RESET}: ").strip().upper()
+            choice = input(f"{Colors.MAGENTA}[?] Enter choice{Colors.RESET} {Colors.CYAN}[R/S/A/C/L/G]{Colors.RESET}: ").strip().upper()
             
             if choice == 'S':
                 return networks, iface, 'single'
@@ -547,8 +897,24 @@ def scan_networks():
             elif choice == 'R':
                 print(f"\n{Colors.YELLOW}[*] Refreshing network list...{Colors.RESET}")
                 continue
+            elif choice == 'C':
+                from .survey import run_continuous_survey
+                run_continuous_survey(interfaces)
+                continue
+            elif choice == 'L':
+                from .survey import run_continuous_survey
+                run_continuous_survey(interfaces, live=True)
+                continue
+            elif choice == 'G':
+                access_points = scan_all_interfaces(interfaces, per_bssid=True)
+                from .channels import build_channel_report, display_channel_report
+                access_point_details = get_scan_details(access_points)
+                display_ssid_groups(group_by_ssid(access_point_details))
+                display_channel_report(build_channel_report(access_point_details))
+                input(f"{Colors.MAGENTA}[?] Press Enter to return to the network list{Colors.RESET}")
+                continue
             else:
-                print(f"{Colors.RED}[✗] Invalid choice. Please enter R, S, or A.{Colors.RESET}")
+                print(f"{Colors.RED}[✗] Invalid choice. Please enter R, S, A, C, L, or G.{Colors.RESET}")
 
     except IndexError:
         print(f"{Colors.RED}[✗] Error: No WiFi interface available.{Colors.RESET}")
@@ -577,7 +943,7 @@ def select_network(networks):
 
             if 0 <= choice < len(networks):
                 print(f"{Colors.GREEN}[✓] Target locked{Colors.RESET}")
-                time.sleep(0.3)
+                cosmetic_pause(0.3)
                 return networks[choice]
             else:
                 print(
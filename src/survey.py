@@ -0,0 +1,518 @@
+"""Continuous background survey with an incremental, BSSID-keyed network table."""
+
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from . import timing
+from .scanner import HIDDEN_SSID_LABEL, LiveNetworkTable, scan_interfaces, get_scan_details
+from .utils import Colors
+
+
+# Default survey settings
+DEFAULT_INTERVAL = 10.0       # seconds between scan starts
+DEFAULT_SIGNAL_THRESHOLD = 5  # dBm change reported as "changed"
+DEFAULT_MISS_LIMIT = 2        # consecutive missed scans before "disappeared"
+DEFAULT_MAX_FAILURES = 3      # consecutive all-interface failures before a headless survey gives up
+
+
+# Result of merging one scan into the table. changed holds (old, new) pairs.
+ScanDelta = namedtuple("ScanDelta", ["timestamp", "appeared", "disappeared", "changed"])
+
+
+class NetworkTable:
+    """In-memory table of surveyed networks keyed by BSSID."""
+
+    def __init__(self, signal_threshold=DEFAULT_SIGNAL_THRESHOLD, miss_limit=DEFAULT_MISS_LIMIT):
+        self.signal_threshold = signal_threshold
+        self.miss_limit = miss_limit
+        self._entries = {}  # bssid -> NetworkDetails
+        self._misses = {}   # bssid -> consecutive scans without a sighting
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, bssid):
+        return bssid in self._entries
+
+    def get(self, bssid):
+        """Return the latest NetworkDetails for a BSSID, or None."""
+        return self._entries.get(bssid)
+
+    def networks(self):
+        """Return the current networks, strongest signal first."""
+        return sorted(self._entries.values(), key=lambda d: d.signal, reverse=True)
+
+    def merge(self, scan_details, timestamp=None):
+        """
+        Merge one scan's NetworkDetails records into the table.
+
+        Args:
+            scan_details (list): NetworkDetails records from a single scan
+            timestamp (float): Epoch time of the scan (defaults to now)
+
+        Returns:
+            ScanDelta: Networks that appeared, disappeared or changed signal
+        """
+        appeared = []
+        changed = []
+        seen = set()
+
+        for details in scan_details:
+            bssid = details.bssid
+            seen.add(bssid)
+            self._misses.pop(bssid, None)
+
+            previous = self._entries.get(bssid)
+            if previous is None:
+                appeared.append(details)
+                self._entries[bssid] = details
+            elif abs(details.signal - previous.signal) >= self.signal_threshold:
+                changed.append((previous, details))
+                self._entries[bssid] = details
+            # Small signal jitter keeps the previous record so deltas stay quiet
+
+        disappeared = []
+        for bssid in list(self._entries):
+            if bssid in seen:
+                continue
+            misses = self._misses.get(bssid, 0) + 1
+            if misses >= self.miss_limit:
+                disappeared.append(self._entries.pop(bssid))
+                self._misses.pop(bssid, None)
+            else:
+                self._misses[bssid] = misses
+
+        return ScanDelta(
+            time.time() if timestamp is None else timestamp,
+            appeared, disappeared, changed,
+        )
+
+
+class ContinuousScanner(threading.Thread):
+    """
+    Background thread that scans on a fixed interval and merges into a NetworkTable.
+
+    Several interfaces can be given (a list); they scan in parallel and their
+    results are merged per access point (see scan_interfaces).
+
+    Every cycle's ScanDelta is passed to on_delta (if it has any changes).
+    Cycles are scheduled from their start time, so the cadence stays steady
+    regardless of how long each scan takes. The current connection is kept
+    unless disconnect=True. If an exporter (ScanExporter) is given, every
+    scan's full record set is appended to it.
+
+    on_scan, if given, is called after every cycle with (scan_details, delta),
+    and on_results with the merged raw scan results of every cycle that
+    wasn't a failure (e.g. to record them for replay, see save_scans).
+    The interfaces that failed in the latest cycle are in self.scan_errors
+    (name -> exception). A cycle in which every interface failed is not
+    merged or exported, and counts towards self.failed_cycles.
+
+    The scanner stops by itself after max_cycles scans (if given). An
+    exception raised during a cycle stops it too and is kept in self.error,
+    as does a run of max_failures consecutive failed cycles (if given).
+    """
+
+    def __init__(self, ifaces, interval=DEFAULT_INTERVAL, on_delta=None, table=None,
+                 disconnect=False, exporter=None, band_filters=None, max_cycles=None,
+                 on_scan=None, max_failures=None, on_results=None):
+        super().__init__(name="continuous-scanner", daemon=True)
+        self.ifaces = list(ifaces) if isinstance(ifaces, (list, tuple)) else [ifaces]
+        self.band_filters = band_filters
+        self.interval = interval
+        self.on_delta = on_delta
+        self.on_scan = on_scan
+        self.on_results = on_results
+        self.table = table if table is not None else NetworkTable()
+        self.disconnect = disconnect
+        self.exporter = exporter
+        self.max_cycles = max_cycles
+        self.max_failures = max_failures
+        self.cycles = 0
+        self.failed_cycles = 0
+        self.scan_errors = {}
+        self.error = None
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Ask the scanner to stop after the current cycle."""
+        self._stop_event.set()
+
+    def run(self):
+        try:
+            self._run_cycles()
+        except Exception as e:
+            self.error = e
+
+    def _run_cycles(self):
+        consecutive_failures = 0
+        while not self._stop_event.is_set():
+            cycle_start = time.monotonic()
+
+            with timing.cycle("survey"):
+                errors = {}
+                networks = scan_interfaces(
+                    self.ifaces, band_filters=self.band_filters, disconnect=self.disconnect,
+                    errors=errors,
+                )
+                self.scan_errors = errors
+                self.cycles += 1
+                failed = len(errors) == len(self.ifaces)
+
+                if failed:
+                    # Nothing was scanned: don't report every network as gone
+                    self.failed_cycles += 1
+                    consecutive_failures += 1
+                    scan_details = []
+                    delta = ScanDelta(time.time(), [], [], [])
+                else:
+                    consecutive_failures = 0
+                    if self.on_results:
+                        self.on_results(networks)
+                    scan_details = get_scan_details(networks)
+                    with timing.stage("survey.merge"):
+                        delta = self.table.merge(scan_details)
+
+                    if self.exporter is not None:
+                        with timing.stage("survey.export"):
+                            self.exporter.write_scan(scan_details, delta.timestamp)
+
+                    if self.on_delta and (delta.appeared or delta.disappeared or delta.changed):
+                        self.on_delta(delta)
+
+                if self.on_scan:
+                    self.on_scan(scan_details, delta)
+
+            if self.max_failures is not None and consecutive_failures >= self.max_failures:
+                reasons = "; ".join(f"{name}: {e}" for name, e in errors.items())
+                self.error = RuntimeError(
+                    f"every interface failed on {consecutive_failures} consecutive scans ({reasons})"
+                )
+                break
+
+            if self.max_cycles is not None and self.cycles >= self.max_cycles:
+                break
+
+            elapsed = time.monotonic() - cycle_start
+            self._stop_event.wait(max(0.0, self.interval - elapsed))
+
+
+def print_scan_delta(delta):
+    """Print the networks that appeared, disappeared or changed in one scan."""
+    stamp = datetime.fromtimestamp(delta.timestamp).strftime("%H:%M:%S")
+
+    for details in delta.appeared:
+        print(f"{Colors.WHITE}{stamp}{Colors.RESET} {Colors.GREEN}[+]{Colors.RESET} "
+              f"{Colors.WHITE}{details.ssid or HIDDEN_SSID_LABEL}{Colors.RESET} {Colors.MAGENTA}{details.bssid}{Colors.RESET} "
+              f"{Colors.CYAN}{details.signal} dBm{Colors.RESET} │ ch {details.channel} │ {details.band}")
+    for previous, details in delta.changed:
+        print(f"{Colors.WHITE}{stamp}{Colors.RESET} {Colors.YELLOW}[~]{Colors.RESET} "
+              f"{Colors.WHITE}{details.ssid or HIDDEN_SSID_LABEL}{Colors.RESET} {Colors.MAGENTA}{details.bssid}{Colors.RESET} "
+              f"{Colors.CYAN}{previous.signal} → {details.signal} dBm{Colors.RESET}")
+    for details in delta.disappeared:
+        print(f"{Colors.WHITE}{stamp}{Colors.RESET} {Colors.RED}[-]{Colors.RESET} "
+              f"{Colors.WHITE}{details.ssid or HIDDEN_SSID_LABEL}{Colors.RESET} {Colors.MAGENTA}{details.bssid}{Colors.RESET}")
+
+
+def run_continuous_survey(ifaces, interval=DEFAULT_INTERVAL, on_delta=print_scan_delta, live=False):
+    """
+    Survey continuously until Ctrl+C, reporting only the changes of each scan.
+
+    ifaces may be a single interface or a list of interfaces to scan in parallel.
+
+    With live=True a LiveNetworkTable is redrawn in place instead of
+    printing a log of changes.
+
+    Returns:
+        NetworkTable: The networks visible when the survey was stopped
+    """
+    table = NetworkTable()
+    if live:
+        live_table = LiveNetworkTable()
+
+        def on_delta(delta):
+            live_table.render(table.networks())
+
+    def print_scan_errors(scan_details, delta):
+        for name, e in scanner.scan_errors.items():
+            print(f"{Colors.RED}[✗] Error during network scan on {name}: {e}{Colors.RESET}")
+
+    # Errors would break the in-place redraw of the live table
+    scanner = ContinuousScanner(ifaces, interval=interval, on_delta=on_delta, table=table,
+                                on_scan=None if live else print_scan_errors)
+    print(f"\n{Colors.YELLOW}[*] Continuous survey every {interval:g}s on "
+          f"{len(scanner.ifaces)} interface(s) - press Ctrl+C to stop{Colors.RESET}")
+
+    scanner.start()
+    try:
+        while scanner.is_alive():
+            scanner.join(0.5)
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}[*] Stopping survey...{Colors.RESET}")
+    finally:
+        scanner.stop()
+        scanner.join()
+
+    if scanner.error is not None:
+        print(f"{Colors.RED}[✗] Survey stopped by an error: {scanner.error}{Colors.RESET}")
+    print(f"{Colors.GREEN}[✓] Survey stopped after {scanner.cycles} scans, "
+          f"{len(scanner.table)} networks in view{Colors.RESET}")
+    return scanner.table
+
+
+# Exit statuses of the headless survey command (argparse uses 2 for usage errors)
+EXIT_OK = 0
+EXIT_SURVEY_ERROR = 1
+EXIT_NO_INTERFACE = 3
+EXIT_EXPORT_ERROR = 4
+EXIT_INTERRUPTED = 130
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(text):
+    """Parse a duration such as "90", "90s", "15m", "1h" or "2d" into seconds."""
+    text = text.strip().lower()
+    multiplier = _DURATION_UNITS.get(text[-1:], None)
+    number = text[:-1] if multiplier else text
+    try:
+        seconds = float(number) * (multiplier or 1)
+    except ValueError:
+        raise ValueError(f"invalid duration '{text}' (use e.g. 90s, 15m, 1h, 2d)")
+    if seconds <= 0:
+        raise ValueError(f"duration must be positive, got '{text}'")
+    return seconds
+
+
+def format_scan_summary(delta, scanner):
+    """One plain-text progress line per scan (for logs)."""
+    stamp = datetime.fromtimestamp(delta.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    return (f"{stamp} scan {scanner.cycles}: {len(scanner.table)} networks "
+            f"(+{len(delta.appeared)} -{len(delta.disappeared)} ~{len(delta.changed)})")
+
+
+def run_headless_survey(ifaces, interval=DEFAULT_INTERVAL, duration=None, max_scans=None,
+                        exporter=None, band_filters=None, disconnect=False, log=None,
+                        error_log=None, max_failures=DEFAULT_MAX_FAILURES, on_results=None):
+    """
+    Survey without prompts until the duration or scan limit is reached.
+
+    SIGTERM and Ctrl+C stop the survey cleanly after the current scan.
+
+    Args:
+        ifaces (list): Interfaces to scan with
+        interval (float): Seconds between scan starts
+        duration (float): Stop after this many seconds (None: run until stopped)
+        max_scans (int): Stop after this many scans (None: no limit)
+        exporter (ScanExporter): Optional export target for every scan
+        band_filters (dict): Optional interface name -> band pinning
+        disconnect (bool): Disconnect each interface before scanning
+        log (file): Stream for per-scan progress lines (None: silent)
+        error_log (file): Stream for per-interface scan errors (None: silent)
+        max_failures (int): Stop with an error after this many consecutive
+            scans in which every interface failed (None: never)
+        on_results (callable): Called with the raw results of every scan
+
+    Returns:
+        tuple: (ContinuousScanner, interrupted)
+    """
+    import signal
+
+    def log_scan(scan_details, delta):
+        if error_log is not None:
+            for name, e in scanner.scan_errors.items():
+                print(f"error: scan {scanner.cycles} failed on {name}: {e}", file=error_log, flush=True)
+        if log is not None:
+            print(format_scan_summary(delta, scanner), file=log, flush=True)
+
+    scanner = ContinuousScanner(
+        ifaces, interval=interval, disconnect=disconnect, exporter=exporter,
+        band_filters=band_filters, max_cycles=max_scans, on_scan=log_scan,
+        max_failures=max_failures, on_results=on_results,
+    )
+
+    def on_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    try:
+        previous_handler = signal.signal(signal.SIGTERM, on_sigterm)
+    except ValueError:
+        # Not the main thread: rely on the caller to stop the survey
+        previous_handler = None
+
+    deadline = None if duration is None else time.monotonic() + duration
+    interrupted = False
+    scanner.start()
+    try:
+        while scanner.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            timeout = 0.5 if deadline is None else min(0.5, max(0.0, deadline - time.monotonic()))
+            scanner.join(timeout)
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        scanner.stop()
+        scanner.join()
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    return scanner, interrupted
+
+
+def main(argv=None):
+    """Headless survey command: scan, extract details and export without prompts."""
+    import argparse
+    import json
+    import sys
+    from .backends import ReplayBackend, get_backend, save_scans, set_backend
+    from .export import DEFAULT_BACKUP_COUNT, DEFAULT_MAX_BYTES, EXPORT_FORMATS, ScanExporter
+
+    def duration_arg(text):
+        try:
+            return parse_duration(text)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    def band_arg(text):
+        name, sep, band = text.rpartition("=")
+        if not sep or band not in ("2.4", "5", "6"):
+            raise argparse.ArgumentTypeError(f"expected IFACE=BAND with BAND 2.4, 5 or 6, got '{text}'")
+        return name, band
+
+    parser = argparse.ArgumentParser(
+        prog="python run.py survey",
+        description="Survey WiFi networks without prompts and export every scan.",
+        epilog=f"Exit status: {EXIT_OK} success, {EXIT_SURVEY_ERROR} survey error (including every "
+               f"interface failing), 2 usage error, "
+               f"{EXIT_NO_INTERFACE} no interface, {EXIT_EXPORT_ERROR} export error, "
+               f"{EXIT_INTERRUPTED} stopped before the duration or scan limit.",
+    )
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"seconds between scan starts (default: {DEFAULT_INTERVAL:g})")
+    parser.add_argument("--duration", type=duration_arg,
+                        help="how long to survey, e.g. 90s, 15m, 1h (default: until stopped)")
+    parser.add_argument("--scans", type=int, help="stop after this many scans")
+    parser.add_argument("--out", help="export file (.jsonl, .csv or .parquet)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="export format (default: from --out)")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES,
+                        help="rotate the export file at this size (0: never)")
+    parser.add_argument("--backup-count", type=int, default=DEFAULT_BACKUP_COUNT,
+                        help="rotated export files to keep")
+    parser.add_argument("--interface", action="append", metavar="NAME",
+                        help="interface to scan with (repeatable, default: all)")
+    parser.add_argument("--band", action="append", type=band_arg, metavar="IFACE=BAND",
+                        help="pin an interface to the 2.4, 5 or 6 GHz band (repeatable)")
+    parser.add_argument("--disconnect", action="store_true",
+                        help="disconnect each interface before scanning")
+    parser.add_argument("--replay", metavar="FILE", help="replay recorded scans instead of scanning")
+    parser.add_argument("--record", metavar="FILE",
+                        help="save the raw results of every scan as a replay file for --replay")
+    parser.add_argument("--max-failures", type=int, default=DEFAULT_MAX_FAILURES,
+                        help="give up after this many consecutive scans in which every interface "
+                             f"failed (default: {DEFAULT_MAX_FAILURES})")
+    parser.add_argument("--quiet", action="store_true",
+                        help="don't log each scan to stderr (scan errors are still logged)")
+    parser.add_argument("--timings", metavar="FILE",
+                        help="write per-stage timings and percentiles as JSON")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="run the scan cycles under cProfile and save the stats (implies timing)")
+    args = parser.parse_args(argv)
+
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    if args.scans is not None and args.scans <= 0:
+        parser.error("--scans must be positive")
+    if args.max_failures <= 0:
+        parser.error("--max-failures must be positive")
+
+    try:
+        if args.replay:
+            set_backend(ReplayBackend.from_file(args.replay))
+        ifaces = get_backend().interfaces()
+    except Exception as e:
+        print(f"error: cannot open WiFi interfaces: {e}", file=sys.stderr)
+        return EXIT_NO_INTERFACE
+
+    if args.interface:
+        ifaces = [iface for iface in ifaces if iface.name() in args.interface]
+    if not ifaces:
+        print("error: no WiFi interface available", file=sys.stderr)
+        return EXIT_NO_INTERFACE
+
+    exporter = None
+    if args.out:
+        try:
+            exporter = ScanExporter(args.out, args.format, args.max_bytes, args.backup_count).open()
+        except (ImportError, OSError, ValueError) as e:
+            print(f"error: cannot export to {args.out}: {e}", file=sys.stderr)
+            return EXIT_EXPORT_ERROR
+
+    recorded = None
+    if args.record:
+        try:
+            open(args.record, "a", encoding="utf-8").close()
+        except OSError as e:
+            print(f"error: cannot record to {args.record}: {e}", file=sys.stderr)
+            if exporter is not None:
+                exporter.close()
+            return EXIT_EXPORT_ERROR
+        recorded = []
+
+    if args.timings or args.profile:
+        timing.enable(profile_path=args.profile)
+
+    started = time.time()
+    record_error = None
+    try:
+        scanner, interrupted = run_headless_survey(
+            ifaces, interval=args.interval, duration=args.duration, max_scans=args.scans,
+            exporter=exporter, band_filters=dict(args.band or ()), disconnect=args.disconnect,
+            log=None if args.quiet else sys.stderr, error_log=sys.stderr,
+            max_failures=args.max_failures,
+            on_results=recorded.append if recorded is not None else None,
+        )
+    finally:
+        if exporter is not None:
+            exporter.close()
+        if recorded is not None:
+            try:
+                save_scans(args.record, recorded)
+            except OSError as e:
+                record_error = e
+        timings = timing.disable()
+        if args.timings and timings is not None:
+            timing.write_summary(args.timings, timings)
+
+    # Machine-readable summary on stdout
+    print(json.dumps({
+        "scans": scanner.cycles,
+        "failed_scans": scanner.failed_cycles,
+        "networks": len(scanner.table),
+        "rows_exported": exporter.rows_written if exporter is not None else 0,
+        "out": args.out,
+        "record": args.record,
+        "interfaces": [iface.name() for iface in scanner.ifaces],
+        "started": started,
+        "elapsed_s": round(time.time() - started, 3),
+        "error": None if scanner.error is None else str(scanner.error),
+    }))
+
+    if record_error is not None:
+        print(f"error: cannot record to {args.record}: {record_error}", file=sys.stderr)
+        return EXIT_EXPORT_ERROR
+    if scanner.error is not None:
+        print(f"error: survey stopped: {scanner.error}", file=sys.stderr)
+        return EXIT_SURVEY_ERROR
+    if scanner.cycles and scanner.failed_cycles == scanner.cycles:
+        print("error: every interface failed on every scan", file=sys.stderr)
+        return EXIT_SURVEY_ERROR
+    if interrupted and (args.duration is not None or args.scans is not None):
+        return EXIT_INTERRUPTED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
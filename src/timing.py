@@ -0,0 +1,289 @@
+"""
+Opt-in stage timing and cProfile hooks for the scan pipeline.
+
+Pipeline code wraps each stage in ``with stage("scan.wait"):`` and each
+scan/display cycle in ``with cycle("scan"):``. While timing is disabled
+(the default) both return a shared no-op context manager, so the cost is
+one function call per stage.
+
+Stages may nest (``scan.wait`` times ``scan.sleep`` and ``scan.results``;
+``scan.details`` and ``display.details`` time the ``details.*`` stages).
+The per-cycle breakdown keeps nested stages apart from the outermost ones,
+so the outermost stages of a cycle never count the same time twice.
+
+    from src import timing
+    timing.enable(profile_path="scan.prof")
+    ...
+    timing.write_summary("timings.json")
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+
+# Samples kept per stage, and cycles kept for the per-cycle breakdown
+DEFAULT_MAX_SAMPLES = 10000
+DEFAULT_MAX_CYCLES = 1000
+
+PERCENTILES = (50, 90, 99)
+
+_NULL_CONTEXT = nullcontext()
+
+# Names of the stages open in each thread, innermost last
+_open_stages = threading.local()
+
+_recorder = None
+
+
+class TimingRecorder:
+    """
+    Collects stage durations and per-cycle breakdowns.
+
+    Stage timings from any thread (e.g. scan_interfaces workers) are added
+    to the cycle that is open when they finish. Cycles don't nest: a cycle
+    opened inside another one is folded into the outer cycle. Stages timed
+    inside another stage are added to the cycle's "nested" breakdown rather
+    than its "stages", and their parents are listed in the summary.
+    """
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES, max_cycles=DEFAULT_MAX_CYCLES,
+                 profile_path=None):
+        self.max_samples = max_samples
+        self.profile_path = profile_path
+        self.stages = {}  # stage name -> deque of durations (ms)
+        self.parents = {}  # nested stage name -> set of enclosing stage names
+        self.cycles = deque(maxlen=max_cycles)
+        self._lock = threading.Lock()
+        self._cycle = None
+        self._cycle_depth = 0
+        self._cycle_start = 0.0
+        self._profiler = None
+        self._profiler_thread = None
+        if profile_path:
+            import cProfile
+            self._profiler = cProfile.Profile()
+
+    def record(self, name, duration_ms, parent=None):
+        """Record one duration for a stage (timed inside stage parent, if given)."""
+        with self._lock:
+            samples = self.stages.get(name)
+            if samples is None:
+                samples = self.stages[name] = deque(maxlen=self.max_samples)
+            samples.append(duration_ms)
+            if parent is not None:
+                self.parents.setdefault(name, set()).add(parent)
+            if self._cycle is not None:
+                breakdown = self._cycle["stages" if parent is None else "nested"]
+                breakdown[name] = breakdown.get(name, 0.0) + duration_ms
+
+    def begin_cycle(self, name):
+        """Open a cycle (or join the one already open)."""
+        with self._lock:
+            self._cycle_depth += 1
+            if self._cycle_depth > 1:
+                return
+            self._cycle = {"name": name, "start": time.time(), "stages": {}, "nested": {}}
+            self._cycle_start = time.perf_counter()
+            # cProfile only sees the thread that enables it, so profile one thread's cycles
+            if self._profiler is not None and self._profiler_thread in (None, threading.get_ident()):
+                self._profiler_thread = threading.get_ident()
+                self._profiler.enable()
+
+    def end_cycle(self):
+        """Close the outermost cycle and keep its breakdown."""
+        with self._lock:
+            self._cycle_depth -= 1
+            if self._cycle_depth > 0:
+                return
+            if self._profiler is not None and self._profiler_thread == threading.get_ident():
+                self._profiler.disable()
+            cycle = self._cycle
+            self._cycle = None
+            cycle["total_ms"] = (time.perf_counter() - self._cycle_start) * 1000.0
+            self.cycles.append(cycle)
+
+    def summary(self):
+        """
+        Machine-readable summary of everything recorded.
+
+        Returns:
+            dict: "stages" maps each stage to its count, total, mean,
+            percentiles and max (ms); "parents" maps each nested stage to
+            the stages it was timed inside; "cycles" maps each cycle name
+            to the same statistics over cycle totals; "recent_cycles" holds
+            the per-cycle breakdowns, oldest first, with the outermost
+            stages under "stages" and nested ones under "nested" (stages
+            of parallel scan workers may overlap each other).
+        """
+        with self._lock:
+            stages = {name: list(samples) for name, samples in self.stages.items()}
+            parents = {name: sorted(names) for name, names in self.parents.items()}
+            cycles = [dict(cycle, stages=dict(cycle["stages"]), nested=dict(cycle["nested"]))
+                      for cycle in self.cycles]
+
+        cycle_totals = {}
+        for cycle in cycles:
+            cycle_totals.setdefault(cycle["name"], []).append(cycle["total_ms"])
+
+        return {
+            "stages": {name: describe(samples) for name, samples in sorted(stages.items())},
+            "parents": dict(sorted(parents.items())),
+            "cycles": {name: describe(totals) for name, totals in sorted(cycle_totals.items())},
+            "recent_cycles": [
+                {
+                    "name": cycle["name"],
+                    "start": cycle["start"],
+                    "total_ms": round(cycle["total_ms"], 3),
+                    "stages": {name: round(ms, 3) for name, ms in cycle["stages"].items()},
+                    "nested": {name: round(ms, 3) for name, ms in cycle["nested"].items()},
+                }
+                for cycle in cycles
+            ],
+        }
+
+    def dump_profile(self):
+        """Write the cProfile statistics to profile_path (if profiling)."""
+        if self._profiler is not None:
+            self._profiler.dump_stats(self.profile_path)
+
+
+class _Stage:
+    """Times one stage and records it on exit."""
+
+    __slots__ = ("recorder", "name", "start", "parent")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_open_stages, "names", None)
+        if stack is None:
+            stack = _open_stages.names = []
+        self.parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration_ms = (time.perf_counter() - self.start) * 1000.0
+        _open_stages.names.pop()
+        self.recorder.record(self.name, duration_ms, self.parent)
+        return False
+
+
+class _Cycle:
+    """Groups the stages timed while it is open into one cycle."""
+
+    __slots__ = ("recorder", "name")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.recorder.begin_cycle(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.end_cycle()
+        return False
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_samples) // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+def describe(samples):
+    """Count, total, mean, percentiles and max of a list of durations (ms)."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    stats = {
+        "count": len(ordered),
+        "total_ms": round(total, 3),
+        "mean_ms": round(total / len(ordered), 3) if ordered else 0.0,
+    }
+    for pct in PERCENTILES:
+        stats[f"p{pct}_ms"] = round(percentile(ordered, pct), 3)
+    stats["max_ms"] = round(ordered[-1], 3) if ordered else 0.0
+    return stats
+
+
+def enable(profile_path=None, max_samples=DEFAULT_MAX_SAMPLES, max_cycles=DEFAULT_MAX_CYCLES):
+    """
+    Start recording stage timings (discarding anything recorded before).
+
+    Args:
+        profile_path (str): Also run cycles under cProfile and write the
+            statistics here when timing is disabled (view with pstats)
+        max_samples (int): Durations kept per stage
+        max_cycles (int): Cycles kept for the per-cycle breakdown
+
+    Returns:
+        TimingRecorder: The active recorder
+    """
+    global _recorder
+    _recorder = TimingRecorder(max_samples, max_cycles, profile_path)
+    return _recorder
+
+
+def disable():
+    """
+    Stop recording, writing the cProfile statistics if profiling.
+
+    Returns:
+        dict: The final summary (None if timing was not enabled)
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    recorder.dump_profile()
+    return recorder.summary()
+
+
+def is_enabled():
+    """Return True while stage timings are being recorded."""
+    return _recorder is not None
+
+
+def is_profiling():
+    """Return True while cycles are being run under cProfile."""
+    recorder = _recorder
+    return recorder is not None and recorder._profiler is not None
+
+
+def stage(name):
+    """Context manager timing one pipeline stage (no-op unless enabled)."""
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_CONTEXT
+    return _Stage(recorder, name)
+
+
+def cycle(name):
+    """Context manager grouping the stages of one scan/display cycle (no-op unless enabled)."""
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_CONTEXT
+    return _Cycle(recorder, name)
+
+
+def summary():
+    """Summary of the active recorder (see TimingRecorder.summary), or None."""
+    recorder = _recorder
+    return recorder.summary() if recorder is not None else None
+
+
+def write_summary(path, data=None):
+    """Write a timing summary (default: the active recorder's) as JSON."""
+    data = summary() if data is None else data
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
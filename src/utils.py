@@ -1,5 +1,6 @@
 """Utility functions for the WiFi password tester."""
 
+import os
 import sys
 from pathlib import Path
 import time
@@ -20,6 +21,17 @@ class Colors:
     RESET = "\033[0m"
 
 
+# Purely cosmetic pauses (banner, menu steps) are skipped unless
+# WIFI_NETHUNTER_DELAYS=1 is set, so scripted runs start immediately
+COSMETIC_DELAYS = os.environ.get("WIFI_NETHUNTER_DELAYS", "") not in ("", "0")
+
+
+def cosmetic_pause(seconds):
+    """Sleep for a cosmetic pause, if cosmetic delays are enabled."""
+    if COSMETIC_DELAYS:
+        time.sleep(seconds)
+
+
 def load_passwords_from_file(filepath):
     """Load passwords from a file, one per line."""
     try:
@@ -53,20 +65,23 @@ def mask_password(password, visible_chars=3):
     return password
 
 
-def check_if_cracked(ssid):
-    """Check if network is already in cracked.json."""
+def load_cracked_networks():
+    """Load cracked.json once and return its entries keyed by SSID."""
     try:
         cracked_file = Path("cracked.json")
         if cracked_file.exists():
             with open(cracked_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
             
-            for net in data.get("cracked_networks", []):
-                if net["ssid"] == ssid:
-                    return net
-        return None
+            return {net["ssid"]: net for net in data.get("cracked_networks", [])}
+        return {}
     except:
-        return None
+        return {}
+
+
+def check_if_cracked(ssid):
+    """Check if network is already in cracked.json."""
+    return load_cracked_networks().get(ssid)
 
 
 def save_cracked_password(ssid, password, signal, auth_type, elapsed_time, attempts):
@@ -130,7 +145,7 @@ def print_banner():
 {Colors.CYAN}►  Only test networks you own or have permission to test{Colors.RESET}
 """
     print(banner)
-    time.sleep(0.5)
+    cosmetic_pause(0.5)
 
 
 def get_password_source():
@@ -149,7 +164,7 @@ def get_password_source():
         # Try to load from data/passwords.txt
         default_path = Path("data/passwords.txt")
         print(f"\n{Colors.YELLOW}[*] Loading default wordlist...{Colors.RESET}")
-        time.sleep(0.3)
+        cosmetic_pause(0.3)
         if default_path.exists():
             passwords = load_passwords_from_file(str(default_path))
             if passwords:
@@ -174,7 +189,7 @@ def get_password_source():
     elif choice == "2":
         filepath = input(f"{Colors.MAGENTA}[?] Enter wordlist path:{Colors.RESET} ").strip()
         print(f"{Colors.YELLOW}[*] Loading custom wordlist...{Colors.RESET}")
-        time.sleep(0.3)
+        cosmetic_pause(0.3)
         passwords = load_passwords_from_file(filepath)
         if passwords is None:
             sys.exit(1)
@@ -1,5 +1,12 @@
 """MAC address vendor database (OUI - Organizationally Unique Identifier)."""
 
+from functools import lru_cache
+from .oui import get_oui_registry, mac_to_int
+
+
+# Number of distinct raw BSSID strings remembered by get_vendor_from_mac
+VENDOR_CACHE_SIZE = 4096
+
 # Dictionary mapping MAC address prefixes (first 3 octets) to vendor names
 # Source: IEEE OUI database and common router manufacturers
 MAC_VENDORS = {
@@ -203,15 +210,13 @@ MAC_VENDORS = {
 }
 
 
-def get_vendor_from_mac(mac_address):
+@lru_cache(maxsize=VENDOR_CACHE_SIZE)
+def _lookup_vendor(mac_address):
     """
-    Identify vendor from MAC address using OUI lookup.
+    Resolve a vendor from a raw MAC address string (memoized).
     
-    Args:
-        mac_address (str): MAC address in format "AA:BB:CC:DD:EE:FF"
-    
-    Returns:
-        str: Vendor name or "Unknown" if not found
+    The curated MAC_VENDORS table is checked first (its short names are used
+    for WPS PIN prioritization), then the full IEEE registry in data/oui.bin.
     """
     if not mac_address or mac_address == "Unknown":
         return "Unknown"
@@ -222,7 +227,44 @@ def get_vendor_from_mac(mac_address):
     # Extract first 3 octets (OUI)
     mac_prefix = ':'.join(mac_address.split(':')[:3])
     
-    return MAC_VENDORS.get(mac_prefix, "Unknown")
+    vendor = MAC_VENDORS.get(mac_prefix)
+    if vendor is not None:
+        return vendor
+    
+    # Fall back to the full IEEE registry (24/28/36-bit prefixes)
+    mac_value = mac_to_int(mac_address)
+    if mac_value is None:
+        return "Unknown"
+    return get_oui_registry().lookup(mac_value) or "Unknown"
+
+
+def get_vendor_from_mac(mac_address):
+    """
+    Identify vendor from MAC address using OUI lookup.
+    
+    Results are memoized on the raw MAC string, so BSSIDs that repeat on
+    every refresh skip normalization entirely.
+    
+    Args:
+        mac_address (str): MAC address in format "AA:BB:CC:DD:EE:FF"
+    
+    Returns:
+        str: Vendor name or "Unknown" if not found
+    """
+    return _lookup_vendor(mac_address)
+
+
+def get_vendors_for_macs(mac_addresses):
+    """
+    Identify vendors for a whole scan's MAC addresses in one pass.
+    
+    Args:
+        mac_addresses (iterable): MAC address strings
+    
+    Returns:
+        dict: Mapping of each distinct MAC address to its vendor name
+    """
+    return {mac: _lookup_vendor(mac) for mac in set(mac_addresses)}
 
 
 def add_custom_vendor(mac_prefix, vendor_name):
@@ -234,6 +276,7 @@ def add_custom_vendor(mac_prefix, vendor_name):
         vendor_name (str): Name of the vendor
     """
     MAC_VENDORS[mac_prefix.upper()] = vendor_name
+    _lookup_vendor.cache_clear()
 
 
 def get_all_vendors():
@@ -184,7 +184,7 @@ def wps_attack(iface, network, vendor="Unknown"):
     from .scanner import get_network_details
     
     details = get_network_details(network)
-    ssid = details['ssid']
+    ssid = details.ssid
     
     print(f"\n{Colors.CYAN}{'═' * 68}{Colors.RESET}")
     print(f"{Colors.BOLD}{Colors.WHITE}[*] WPS PIN ATTACK MODE{Colors.RESET}")
@@ -247,8 +247,8 @@ def wps_attack(iface, network, vendor="Unknown"):
     print(f"{Colors.RED}{'═' * 68}{Colors.RESET}")
     
     print(f"\n{Colors.YELLOW}[!] For real WPS attacks, use:{Colors.RESET}")
-    print(f"    {Colors.CYAN}• reaver -i wlan0mon -b {details['bssid']} -vv{Colors.RESET}")
-    print(f"    {Colors.CYAN}• bully wlan0mon -b {details['bssid']} -v 3{Colors.RESET}")
+    print(f"    {Colors.CYAN}• reaver -i wlan0mon -b {details.bssid} -vv{Colors.RESET}")
+    print(f"    {Colors.CYAN}• bully wlan0mon -b {details.bssid} -v 3{Colors.RESET}")
     
     return False, None, None
 